@@ -0,0 +1,101 @@
+"""
+Recall and latency of the IVF passage index (retrieval/ann.py) against exact search.
+
+Usage:
+    python -m benchmarks.ann_recall                              # 100k synthetic passages
+    python -m benchmarks.ann_recall --rows 1000000 --probes 8,32,128 --json
+    python -m benchmarks.ann_recall --vectors passages.npy --dtype int8
+
+Synthetic vectors are drawn around random topic centres, so they cluster the way passage
+embeddings do; --vectors benchmarks a saved (rows x width) float32 matrix instead. Queries are
+fresh draws from the same distribution (or held-out rows). recall@k is the share of the exact
+top k that the approximate search also returns.
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from retrieval.ann import IvfIndex, default_n_lists
+from retrieval.semantic import DenseIndex
+
+
+def synthetic_vectors(rows, width, topics, spread, rng):
+    centres = rng.standard_normal((topics, width)).astype(np.float32)
+    centres /= np.linalg.norm(centres, axis=1, keepdims=True)
+    vectors = centres[rng.integers(topics, size=rows)] + spread * rng.standard_normal((rows, width)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def timed_search(index, queries, k):
+    latencies, results = [], []
+    for query in queries:
+        started = time.perf_counter()
+        results.append(index.search(query, k)[0])
+        latencies.append(time.perf_counter() - started)
+    return results, np.asarray(latencies) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure IVF recall and latency against exact search.")
+    parser.add_argument("--rows", type=int, default=100_000, help="synthetic passages")
+    parser.add_argument("--width", type=int, default=96, help="embedding width (en_core_web_sm's tok2vec is 96)")
+    parser.add_argument("--topics", type=int, default=500)
+    parser.add_argument("--spread", type=float, default=0.08, help="per-dimension noise around each topic centre")
+    parser.add_argument("--vectors", help="benchmark this .npy matrix instead of synthetic vectors")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--lists", type=int, default=0, help="IVF lists (default: about 4 * sqrt(rows))")
+    parser.add_argument("--probes", default="1,4,8,16,32,64", help="comma-separated n_probes values to try")
+    parser.add_argument("--dtype", default="float32", choices=["float32", "int8"])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print one JSON object per setting")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    if args.vectors:
+        vectors = np.load(args.vectors).astype(np.float32)
+        held_out = rng.choice(len(vectors), args.queries, replace=False)
+        queries = vectors[held_out]
+        vectors = np.delete(vectors, held_out, axis=0)
+    else:
+        both = synthetic_vectors(args.rows + args.queries, args.width, args.topics, args.spread, rng)
+        vectors, queries = both[:args.rows], both[args.rows:]
+
+    dense = DenseIndex(vectors, args.dtype)
+    exact, exact_ms = timed_search(dense, queries, args.k)
+    n_lists = args.lists or default_n_lists(len(vectors))
+    started = time.perf_counter()
+    ivf = IvfIndex.build(dense, n_lists, n_probes=1)
+    build_seconds = time.perf_counter() - started
+
+    rows = [{
+        "setting": "exact", "rows": len(vectors), "recall": 1.0,
+        "mean_ms": float(exact_ms.mean()), "p95_ms": float(np.percentile(exact_ms, 95)),
+    }]
+    for n_probes in (int(value) for value in args.probes.split(",")):
+        ivf.n_probes = n_probes
+        approximate, ivf_ms = timed_search(ivf, queries, args.k)
+        recall = np.mean([
+            len(np.intersect1d(found, truth)) / max(1, len(truth)) for found, truth in zip(approximate, exact)
+        ])
+        rows.append({
+            "setting": f"ivf lists={len(ivf.centroids)} probes={n_probes}", "rows": len(vectors),
+            "recall": float(recall), "mean_ms": float(ivf_ms.mean()), "p95_ms": float(np.percentile(ivf_ms, 95)),
+            "build_s": round(build_seconds, 2),
+        })
+
+    if args.json:
+        for row in rows:
+            print(json.dumps(row))
+        return
+    print(f"{len(vectors)} x {vectors.shape[1]} {args.dtype} vectors, {len(queries)} queries, recall@{args.k}; "
+          f"IVF build {build_seconds:.2f}s")
+    print(f"{'setting':<32}{'recall':>8}{'mean ms':>10}{'p95 ms':>10}")
+    for row in rows:
+        print(f"{row['setting']:<32}{row['recall']:>8.3f}{row['mean_ms']:>10.3f}{row['p95_ms']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
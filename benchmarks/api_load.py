@@ -0,0 +1,111 @@
+"""
+Load test for the JSON API (retrieval/api.py): concurrent clients on keep-alive connections.
+
+Usage:
+    python -m retrieval.api &                                        # the server under test
+    python -m benchmarks.api_load                                    # 16 clients for 10 seconds
+    python -m benchmarks.api_load --clients 64 --duration 30 --batch 20 --json
+
+Each client is a thread holding one persistent HTTP/1.1 connection and sending the labelled queries
+(benchmarks/queries.jsonl by default) round-robin, one per POST /query, or --batch of them per
+POST /batch. Reports requests and queries per second, latency percentiles, and the responses by
+status, so 503s from the in-flight limit show up next to the latency they protect.
+"""
+import argparse
+import http.client
+import itertools
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_QUERIES = os.path.join(BENCHMARK_DIR, "queries.jsonl")
+
+
+def percentile(ordered, q):
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def client(url, queries, batch, deadline, offset, results):
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+    path, field = ("/batch", "queries") if batch else ("/query", "query")
+    queries = itertools.islice(itertools.cycle(queries), offset, None)
+    latencies, statuses = [], {}
+    while time.perf_counter() < deadline:
+        payload = [next(queries) for _ in range(batch)] if batch else next(queries)
+        body = json.dumps({field: payload})
+        started = time.perf_counter()
+        try:
+            connection.request("POST", path, body, {"Content-Type": "application/json"})
+            response = connection.getresponse()
+            response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            status = "error"
+            connection.close()  # Reconnects on the next request.
+        latencies.append(time.perf_counter() - started)
+        statuses[status] = statuses.get(status, 0) + 1
+    connection.close()
+    results.append((latencies, statuses))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the GovFocus JSON API.")
+    parser.add_argument("--url", default="http://127.0.0.1:8502", help="base URL of the API")
+    parser.add_argument("--queries", default=DEFAULT_QUERIES, help="JSONL query set (only the query field is used)")
+    parser.add_argument("--clients", type=int, default=16, help="concurrent keep-alive connections")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run")
+    parser.add_argument("--batch", type=int, default=0, help="queries per POST /batch (0: one per POST /query)")
+    parser.add_argument("--json", action="store_true", help="print the summary as one JSON object")
+    args = parser.parse_args(argv)
+
+    with open(args.queries, encoding="utf-8") as lines:
+        queries = [json.loads(line)["query"] for line in lines if line.strip()]
+    results = []
+    deadline = time.perf_counter() + args.duration
+    started = time.perf_counter()
+    threads = [
+        threading.Thread(target=client, args=(args.url, queries, args.batch, deadline, i * 7, results))
+        for i in range(args.clients)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency * 1000 for client_latencies, _ in results for latency in client_latencies)
+    statuses = {}
+    for _, client_statuses in results:
+        for status, count in client_statuses.items():
+            statuses[str(status)] = statuses.get(str(status), 0) + count
+    succeeded = statuses.get("200", 0)
+    summary = {
+        "clients": args.clients,
+        "batch": args.batch,
+        "seconds": round(elapsed, 2),
+        "requests": len(latencies),
+        "requests_per_s": round(len(latencies) / elapsed, 1),
+        "queries_per_s": round(succeeded * max(1, args.batch) / elapsed, 1),
+        "p50_ms": percentile(latencies, 0.5),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+        "statuses": statuses,
+    }
+    if args.json:
+        print(json.dumps(summary))
+        return
+    print(f"{summary['requests']} requests from {args.clients} clients in {summary['seconds']}s: "
+          f"{summary['requests_per_s']} requests/s, {summary['queries_per_s']} answered queries/s")
+    if latencies:
+        print(f"latency p50 {summary['p50_ms']:.2f} ms, p95 {summary['p95_ms']:.2f} ms, p99 {summary['p99_ms']:.2f} ms")
+    print("statuses: " + ", ".join(f"{status}: {count}" for status, count in sorted(statuses.items())))
+
+
+if __name__ == "__main__":
+    main()
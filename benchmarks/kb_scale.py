@@ -0,0 +1,81 @@
+"""
+How index build time, memory and query latency scale with the size of the knowledge base.
+
+Usage:
+    python -m benchmarks.kb_scale                                    # 10k, 100k and 1M passages
+    python -m benchmarks.kb_scale --sizes 10000,50000 --mode hybrid --json > scale.json
+
+For each size it generates a synthetic KB with its labelled queries (benchmarks.synthetic_kb),
+reusing the files in --workdir from an earlier run with the same size and seed, and runs
+benchmarks.retrieval_bench on them with --compile in a fresh process, so every size pays for
+its own index build and reports its own peak memory. "build" below is the time to compile the
+index and bring up the engine.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks import synthetic_kb
+
+DEFAULT_SIZES = "10000,100000,1000000"
+
+
+def run_size(passages, args):
+    kb_path = os.path.join(args.workdir, f"synthetic-{passages}-{args.seed}.jsonl")
+    queries_path = os.path.splitext(kb_path)[0] + ".queries.jsonl"
+    if not (os.path.exists(kb_path) and os.path.exists(queries_path)):
+        synthetic_kb.main([
+            "--passages", str(passages), "--output", kb_path, "--queries", str(args.queries), "--seed", str(args.seed),
+        ])
+    command = [
+        sys.executable, "-m", "benchmarks.retrieval_bench", "--kb", kb_path, "--queries", queries_path,
+        "--compile", "--json", "--repeat", str(args.repeat), "--mode", args.mode,
+    ]
+    if args.ranker:
+        command += ["--ranker", args.ranker]
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run(command, cwd=project_root, capture_output=True, text=True)
+    if output.returncode:
+        sys.stderr.write(output.stderr)
+        raise SystemExit(f"retrieval_bench failed at {passages} passages")
+    return json.loads(output.stdout)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark index build, memory and latency on synthetic KBs.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma-separated passage counts")
+    parser.add_argument("--workdir", default=os.path.join(tempfile.gettempdir(), "govfocus-scale"),
+                        help="where the synthetic KBs are written and reused")
+    parser.add_argument("--queries", type=int, default=300, help="labelled queries per KB")
+    parser.add_argument("--repeat", type=int, default=1, help="passes over the queries per size")
+    parser.add_argument("--mode", default="lexical", choices=["lexical", "semantic", "hybrid"])
+    parser.add_argument("--ranker", choices=["tfidf", "bm25"])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the retrieval_bench report of every size as a JSON list")
+    args = parser.parse_args(argv)
+    os.makedirs(args.workdir, exist_ok=True)
+
+    reports = []
+    if not args.json:
+        print(f"{'passages':>10}{'keys':>10}{'build s':>10}{'peak MB':>10}{'p50 ms':>9}{'p95 ms':>9}"
+              f"{'p99 ms':>9}{'q/s':>8}{'batch q/s':>11}{'top-1':>7}")
+    for passages in (int(size) for size in args.sizes.split(",")):
+        report = run_size(passages, args)
+        report["passages"] = passages
+        reports.append(report)
+        if not args.json:
+            single = report["single"]
+            print(f"{passages:>10}{report['settings']['kb_keys']:>10}{report['cold_start']['engine_s']:>10.1f}"
+                  f"{report['peak_rss_mb']:>10.0f}{single['p50_ms']:>9.2f}{single['p95_ms']:>9.2f}"
+                  f"{single['p99_ms']:>9.2f}{single['qps']:>8.0f}{report['batch']['qps']:>11.0f}"
+                  f"{report['accuracy']['top1']:>7.2f}", flush=True)
+    if args.json:
+        json.dump(reports, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
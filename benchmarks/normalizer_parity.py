@@ -0,0 +1,86 @@
+"""
+Parity and speed of the lemma-lookup query normalizer against the full spaCy pipeline.
+
+Usage:
+    python -m benchmarks.normalizer_parity                     # queries generated from the KB
+    python -m benchmarks.normalizer_parity --queries queries.txt --json
+
+Every query the lookup path answers (the rest fall back to spaCy and cannot differ) must produce
+the same processed tokens as nlp.preprocess_text_for_matching without a lemma table. The script
+lists any that do not and exits with status 1; tests/test_normalizer.py runs the same check on
+the shipped KB under pytest. It also reports how many queries the lookup path covers and what each
+path costs.
+
+The generated queries are the KB keys, question templates around them, and the opening words of
+every passage, which put KB words into contexts the KB itself does not have.
+"""
+import argparse
+import json
+import sys
+import time
+
+from retrieval.config import LEMMA_LOOKUP_MAX_TOKENS
+from retrieval.index import get_kb_index
+from retrieval.nlp import _lookup_processed_tokens, preprocess_text_for_matching
+
+TEMPLATES = ("what is the {}?", "who is the {}", "tell me about {}", "{} in nigeria", "Information on the {} please")
+
+
+def kb_queries(kb_index):
+    queries = list(kb_index.keys)
+    queries += [template.format(key) for key in kb_index.keys for template in TEMPLATES]
+    queries += [" ".join(passage.split()[:LEMMA_LOOKUP_MAX_TOKENS]) for passage in kb_index.passage_index.passages]
+    return queries
+
+
+def timed(function, queries):
+    started = time.perf_counter()
+    results = [function(query) for query in queries]
+    return results, (time.perf_counter() - started) / max(1, len(queries)) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the lemma-lookup normalizer against spaCy.")
+    parser.add_argument("--queries", type=argparse.FileType("r", encoding="utf-8"),
+                        help="one query per line (default: queries generated from the KB)")
+    parser.add_argument("--show", type=int, default=20, help="mismatches to print")
+    parser.add_argument("--json", action="store_true", help="print the summary as one JSON object")
+    args = parser.parse_args(argv)
+
+    kb_index = get_kb_index()
+    if args.queries:
+        queries = [line.strip() for line in args.queries if line.strip()]
+    else:
+        queries = kb_queries(kb_index)
+
+    preprocess_text_for_matching("warm up")  # Load the pipeline outside the timings.
+    lookup, lookup_us = timed(lambda query: _lookup_processed_tokens(query.lower(), kb_index.lemma_table), queries)
+    covered = [(query, tokens) for query, tokens in zip(queries, lookup) if tokens is not None]
+    expected, spacy_us = timed(preprocess_text_for_matching, [query for query, _ in covered])
+    mismatches = [
+        {"query": query, "lookup": tokens, "spacy": spacy_tokens}
+        for (query, tokens), spacy_tokens in zip(covered, expected) if tokens != spacy_tokens
+    ]
+
+    summary = {
+        "queries": len(queries),
+        "covered": len(covered),
+        "mismatches": len(mismatches),
+        "parity": 1 - len(mismatches) / max(1, len(covered)),
+        "lookup_us": round(lookup_us, 1),
+        "spacy_us": round(spacy_us, 1),
+        "lemma_table_forms": len(kb_index.lemma_table),
+    }
+    if args.json:
+        print(json.dumps(dict(summary, examples=mismatches[:args.show]), ensure_ascii=False))
+    else:
+        print(f"{summary['covered']} of {summary['queries']} queries normalised by lookup, "
+              f"{summary['mismatches']} differ from spaCy (parity {summary['parity']:.4f})")
+        print(f"lookup {summary['lookup_us']} us/query, spaCy {summary['spacy_us']} us/query")
+        for mismatch in mismatches[:args.show]:
+            print(f"  {mismatch['query']!r}: lookup {mismatch['lookup']!r}, spaCy {mismatch['spacy']!r}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+End-to-end retrieval benchmark over a labelled query set: speed, memory and answer quality in one
+machine-readable report, to compare across commits and settings.
+
+Usage:
+    python -m benchmarks.retrieval_bench                            # human-readable summary
+    python -m benchmarks.retrieval_bench --json > results.json      # one JSON object
+    python -m benchmarks.retrieval_bench --mode hybrid --threshold 0.25 --output runs/hybrid.json
+    python -m benchmarks.retrieval_bench --compile                  # cold start includes compiling the index
+
+Each line of the query set (benchmarks/queries.jsonl by default) is {"query", "expected", "category"}:
+expected is the KB key that should answer it, or null if the bot should fall back. A match counts
+as correct if it returns the same answer as the expected key, so any alias of it will do.
+
+Reported:
+    cold_start     seconds to import the package, build the engine (map or compile the index) and
+                   answer a first query, in this fresh process, and then to warm up on the query set
+    single         queries/s and latency percentiles of RetrievalEngine.respond, one query at a time,
+                   with the answer cache cleared before each query unless --cached
+    batch          queries/s of RetrievalEngine.search_batch over the same queries
+    accuracy       top-1 (answered with the expected answer), top-k (expected answer among the k
+                   matches), fallback rate, and answers given to queries that should fall back,
+                   overall and per category
+    peak_rss_mb    peak resident memory of the process
+"""
+import time
+
+_STARTED = time.perf_counter()  # Before anything else is imported, for the cold start time.
+
+import argparse
+import atexit
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_QUERIES = os.path.join(BENCHMARK_DIR, "queries.jsonl")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark retrieval speed and accuracy on a labelled query set.")
+    parser.add_argument("--queries", default=DEFAULT_QUERIES, help="labelled JSONL query set")
+    parser.add_argument("--kb", help="KB data file to benchmark (default: GOVFOCUS_KB_PATH or data/knowledge_base.jsonl)")
+    parser.add_argument("--mode", choices=["lexical", "semantic", "hybrid"], help="retrieval mode")
+    parser.add_argument("--ranker", choices=["tfidf", "bm25"], help="lexical ranker")
+    parser.add_argument("--normalizer", choices=["lookup", "spacy"], help="query normalizer")
+    parser.add_argument("--threshold", type=float, help="score needed to answer (default: the engine's)")
+    parser.add_argument("--k", type=int, default=3, help="matches per query for top-k accuracy")
+    parser.add_argument("--repeat", type=int, default=3, help="passes over the query set for the latency figures")
+    parser.add_argument("--cached", action="store_true", help="keep the answer cache between queries")
+    parser.add_argument("--compile", action="store_true", help="compile the index into a fresh directory first")
+    parser.add_argument("--json", action="store_true", help="print the report as one JSON object")
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    return parser.parse_args(argv)
+
+
+def configure(args):
+    # Settings are read from the environment when retrieval.config is imported, so set them first.
+    overrides = {
+        "GOVFOCUS_KB_PATH": args.kb and os.path.abspath(args.kb),
+        "GOVFOCUS_RETRIEVAL_MODE": args.mode,
+        "GOVFOCUS_RANKER": args.ranker,
+        "GOVFOCUS_QUERY_NORMALIZER": args.normalizer,
+        # Keep sampled trace logs out of the output and the timings.
+        "GOVFOCUS_TELEMETRY_SAMPLE_RATE": "0",
+    }
+    if args.compile:
+        # Synthetic KBs make artifacts of hundreds of megabytes, so do not leave them behind.
+        overrides["GOVFOCUS_KB_INDEX_DIR"] = tempfile.mkdtemp(prefix="govfocus-bench-")
+        atexit.register(shutil.rmtree, overrides["GOVFOCUS_KB_INDEX_DIR"], ignore_errors=True)
+    for name, value in overrides.items():
+        if value is not None:
+            os.environ[name] = value
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    position = (len(ordered) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BENCHMARK_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def accuracy(records, results, engine):
+    """
+    Scores one list of matches per labelled query; returns the overall and per-category figures.
+    """
+    answer_of = {key: int(body) for key, body in zip(engine.kb_index.keys, engine.kb_index.key_bodies)}
+
+    def summarise(pairs):
+        expected_answer = [(record, matches) for record, matches in pairs if record["expected"] is not None]
+        out_of_scope = [(record, matches) for record, matches in pairs if record["expected"] is None]
+        top1 = topk = fallbacks = false_answers = 0
+        for record, matches in pairs:
+            answered = engine.is_answer(matches)
+            fallbacks += not answered
+            if record["expected"] is None:
+                false_answers += answered
+                continue
+            wanted = answer_of[record["expected"]]
+            top1 += answered and answer_of[matches[0][0]] == wanted
+            topk += any(answer_of[key] == wanted for key, _, _ in matches)
+        return {
+            "queries": len(pairs),
+            "top1": top1 / len(expected_answer) if expected_answer else None,
+            "topk": topk / len(expected_answer) if expected_answer else None,
+            "fallback_rate": fallbacks / len(pairs) if pairs else None,
+            "false_answer_rate": false_answers / len(out_of_scope) if out_of_scope else None,
+        }
+
+    pairs = list(zip(records, results))
+    report = summarise(pairs)
+    categories = sorted({record.get("category", "all") for record in records})
+    report["by_category"] = {
+        category: summarise([pair for pair in pairs if pair[0].get("category", "all") == category])
+        for category in categories
+    }
+    return report
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure(args)
+
+    import_started = time.perf_counter()
+    from retrieval.engine import get_engine
+    imported = time.perf_counter()
+    engine = get_engine()
+    engine_ready = time.perf_counter()
+    if args.threshold is not None:
+        engine.similarity_threshold = args.threshold
+    with open(args.queries, encoding="utf-8") as lines:
+        records = [json.loads(line) for line in lines if line.strip()]
+    engine.respond(records[0]["query"], k=args.k)
+    first_answer = time.perf_counter()
+    cold_start = {
+        "import_s": imported - import_started,
+        "engine_s": engine_ready - imported,
+        "first_query_s": first_answer - engine_ready,
+        "total_s": first_answer - _STARTED,
+    }
+
+    # One untimed pass loads whatever the first query did not need, such as the spaCy pipeline for
+    # queries the lemma lookup cannot normalise, so the latency figures are of a warm process.
+    queries = [record["query"] for record in records]
+    for query in queries:
+        engine.respond(query, k=args.k)
+    cold_start["warm_up_s"] = time.perf_counter() - first_answer
+    engine.answer_cache.clear()
+    latencies, first_pass = [], []
+    started = time.perf_counter()
+    for repetition in range(args.repeat):
+        for query in queries:
+            if not args.cached:
+                engine.answer_cache.clear()
+            query_started = time.perf_counter()
+            _, matches = engine.respond(query, k=args.k)
+            latencies.append(time.perf_counter() - query_started)
+            if repetition == 0:
+                first_pass.append(matches)
+    single_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    engine.search_batch(queries, k=args.k)
+    batch_seconds = time.perf_counter() - started
+
+    latencies_ms = [seconds * 1000 for seconds in latencies]
+    report = {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "settings": {
+            "kb_path": os.environ.get("GOVFOCUS_KB_PATH"),
+            "kb_keys": len(engine.kb_index),
+            "kb_passages": len(engine.kb_index.passage_index.passages),
+            "retrieval_mode": engine.retrieval_mode,
+            "ranker": engine.kb_index.ranker_name,
+            "query_normalizer": "lookup" if engine.lemma_table is not None else "spacy",
+            "threshold": engine.similarity_threshold,
+            "k": args.k,
+            "cached": args.cached,
+            "compiled": args.compile,
+        },
+        "cold_start": cold_start,
+        "single": {
+            "queries": len(latencies),
+            "qps": len(latencies) / single_seconds if single_seconds else None,
+            "mean_ms": sum(latencies_ms) / len(latencies_ms),
+            "p50_ms": percentile(latencies_ms, 0.5),
+            "p95_ms": percentile(latencies_ms, 0.95),
+            "p99_ms": percentile(latencies_ms, 0.99),
+            "max_ms": max(latencies_ms),
+        },
+        "batch": {"queries": len(queries), "qps": len(queries) / batch_seconds if batch_seconds else None},
+        "accuracy": accuracy(records, first_pass, engine),
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+    settings, single, quality = report["settings"], report["single"], report["accuracy"]
+    print(f"{settings['retrieval_mode']}/{settings['ranker']}, normalizer {settings['query_normalizer']}, "
+          f"threshold {settings['threshold']}, {settings['kb_keys']} keys, commit {report['commit']}")
+    print(f"cold start {cold_start['total_s']:.2f}s (import {cold_start['import_s']:.2f}s, "
+          f"engine {cold_start['engine_s']:.2f}s, first query {cold_start['first_query_s']:.3f}s), "
+          f"warm-up {cold_start['warm_up_s']:.2f}s")
+    print(f"single: {single['qps']:.0f} q/s, p50 {single['p50_ms']:.2f} ms, p95 {single['p95_ms']:.2f} ms, "
+          f"p99 {single['p99_ms']:.2f} ms; batch: {report['batch']['qps']:.0f} q/s; peak RSS {report['peak_rss_mb']:.0f} MB")
+    print(f"{'category':<14}{'queries':>8}{'top-1':>8}{'top-' + str(args.k):>8}{'fallback':>10}{'false ans':>11}")
+    rows = [("all", quality)] + list(quality["by_category"].items())
+    for category, figures in rows:
+        cells = [figures[name] for name in ("top1", "topk", "fallback_rate", "false_answer_rate")]
+        cells = ["-" if value is None else f"{value:.2f}" for value in cells]
+        print(f"{category:<14}{figures['queries']:>8}{cells[0]:>8}{cells[1]:>8}{cells[2]:>10}{cells[3]:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Synthetic knowledge bases at scale, shaped like the real one, for stress-testing the index.
+
+Usage:
+    python -m benchmarks.synthetic_kb --passages 100000 --output /tmp/kb100k.jsonl
+    python -m benchmarks.synthetic_kb --passages 1000000 --output /tmp/kb1m.jsonl --queries 500 --seed 1
+
+Everything is modelled on data/knowledge_base.jsonl (or --source):
+    text        a word bigram chain over the real answers, so word frequencies, phrasing and
+                punctuation follow the real KB; proper nouns are swapped for names minted from the
+                real ones ("Abuja" + "Anambra" -> "Abumbra"), so the vocabulary keeps growing with the
+                KB as a real one would instead of saturating at the source's few thousand words
+    lengths     passage word counts, sentence word counts, passages per answer and the share of
+                bullet passages are sampled from the real KB's
+    keys        real keys with their proper nouns replaced by the entry's minted names, plus aliases
+                at the real KB's alias rate
+
+Next to the KB it writes a labelled query set (<output>.queries.jsonl by default) in the format
+of benchmarks/queries.jsonl: exact keys, questions around keys, passage openings, and the
+out-of-scope queries of the real set, so the KB feeds benchmarks.retrieval_bench directly.
+benchmarks.kb_scale runs that at several sizes.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+
+from retrieval.config import KB_DATA_PATH
+from retrieval.kb_data import load_knowledge_base
+from retrieval.passage_index import BULLET_PATTERN, SOURCE_PATTERN, split_passages
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REAL_QUERIES = os.path.join(BENCHMARK_DIR, "queries.jsonl")
+
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+# A capitalised word of four or more letters, the kind minted names are made from.
+_NAME_RE = re.compile(r"^[A-Z][a-z]{3,}$")
+# Capitalised words in keys that name a kind of thing rather than a particular one.
+KEY_WORDS = frozenset(
+    "Nigeria Nigerian Nigeria's State Governor President Minister Ministry Federal National "
+    "Republic History Senate House Assembly Court Chief Justice Party Anthem Capital".split()
+)
+QUESTION_TEMPLATES = ("what is the {}?", "who is the {}", "tell me about {}", "{} in nigeria", "information on {} please")
+
+
+class SourceModel:
+    """
+    The statistics of a real knowledge base that synthetic entries are drawn from.
+    """
+    def __init__(self, knowledge_base):
+        answers = list(dict.fromkeys(knowledge_base.values()))
+        alias_keys = len(knowledge_base) - len(answers)
+        self.alias_rate = alias_keys / len(answers)
+        self.keys = list(dict.fromkeys(knowledge_base))
+
+        self.passages_per_answer = []
+        self.passage_words = []
+        self.sentence_words = []
+        self.starters = []
+        self.followers = {}
+        bullets = passages = 0
+        names = set()
+        for answer in answers:
+            answer_passages = split_passages(answer)
+            self.passages_per_answer.append(len(answer_passages))
+            for passage in answer_passages:
+                passages += 1
+                if BULLET_PATTERN.match(passage):
+                    bullets += 1
+                    passage = BULLET_PATTERN.sub("", passage)
+                words = passage.split()
+                self.passage_words.append(len(words))
+                for sentence in _SENTENCE_END_RE.split(" ".join(words)):
+                    sentence_words = sentence.split()
+                    if not sentence_words:
+                        continue
+                    self.sentence_words.append(len(sentence_words))
+                    self.starters.append(sentence_words[0])
+                    # Followers are kept with repeats, so random.choice draws them by bigram frequency.
+                    for word, next_word in zip(sentence_words, sentence_words[1:]):
+                        self.followers.setdefault(word, []).append(next_word)
+                    names.update(word for word in sentence_words[1:] if _NAME_RE.match(word) and word not in KEY_WORDS)
+        self.bullet_rate = bullets / passages
+        # A passage opening with a citation would be merged into the one before it.
+        self.openers = [word for word in self.starters if not SOURCE_PATTERN.match(word)]
+        self.names = sorted(names)
+        self.name_set = frozenset(self.names)
+
+    def mint_name(self, rng):
+        """
+        Returns a new proper noun spliced from the start of one real name and the end of another.
+        """
+        head, tail = rng.choice(self.names), rng.choice(self.names)
+        return head[:rng.randint(2, 4)] + tail[-rng.randint(3, 5):].lower()
+
+    def sentence(self, rng, length, names, starters=None):
+        words = [rng.choice(starters or self.starters)]
+        while len(words) < length:
+            followers = self.followers.get(words[-1])
+            words.append(rng.choice(followers) if followers else rng.choice(self.starters))
+        # Some proper nouns become the entry's own names, the rest stay as real ones.
+        words = [rng.choice(names) if word in self.name_set and rng.random() < 0.3 else word for word in words]
+        words[-1] = words[-1].rstrip(".,;:!?") + "."
+        return " ".join(words)
+
+    def passage(self, rng, names):
+        target = rng.choice(self.passage_words)
+        sentences, words = [], 0
+        while words < target:
+            length = min(rng.choice(self.sentence_words), max(3, target - words))
+            sentences.append(self.sentence(rng, length, names, None if sentences else self.openers))
+            words += length
+        return " ".join(sentences)
+
+    def key(self, rng, names):
+        """
+        Returns a real key with its proper nouns replaced by names, or prefixed with one if it has none.
+        """
+        words = rng.choice(self.keys).split()
+        slots = [i for i, word in enumerate(words) if word[:1].isupper() and word not in KEY_WORDS]
+        if not slots:
+            return f"{names[0]} {' '.join(words)}"
+        for slot, name in zip(slots, names * len(slots)):
+            words[slot] = name
+        return " ".join(words)
+
+
+def alias_for(key):
+    """
+    Another way of naming key, as the real aliases do: "Governor of Kano State" -> "Kano State Governor".
+    """
+    if " of " in key:
+        head, tail = key.split(" of ", 1)
+        return f"{tail} {head}"
+    return f"{key} in Nigeria"
+
+
+def generate(model, n_passages, rng):
+    """
+    Yields (key, answer, aliases) entries until they hold n_passages passages between them.
+    """
+    used_keys = set()
+    passages = 0
+    while passages < n_passages:
+        names = [model.mint_name(rng) for _ in range(rng.randint(1, 2))]
+        key = model.key(rng, names)
+        while key.lower() in used_keys:
+            names[0] = model.mint_name(rng)
+            key = model.key(rng, names)
+        used_keys.add(key.lower())
+
+        count = min(rng.choice(model.passages_per_answer), n_passages - passages)
+        passages += count
+        blocks = []
+        for _ in range(count):
+            text = model.passage(rng, names)
+            if blocks and rng.random() < model.bullet_rate:
+                # Consecutive bullets share a block, one passage per bullet, like the real lists.
+                if blocks[-1].startswith("* "):
+                    blocks[-1] += "\n* " + text
+                else:
+                    blocks.append("* " + text)
+            else:
+                blocks.append(text)
+        # The opening paragraph names the entry, as real answers do, which also keeps every answer distinct.
+        blocks[0] = f"{key}: {blocks[0]}"
+
+        aliases = []
+        if rng.random() < model.alias_rate:
+            alias = alias_for(key)
+            if alias.lower() not in used_keys:
+                used_keys.add(alias.lower())
+                aliases.append(alias)
+        yield key, "\n\n".join(blocks), aliases
+
+
+def sample_queries(entries, n_queries, rng, real_queries=REAL_QUERIES):
+    """
+    Returns labelled queries over a sample of the generated entries, plus the real set's out-of-scope ones.
+    """
+    queries = []
+    for key, answer, aliases in rng.sample(entries, min(n_queries, len(entries))):
+        category = rng.choice(("exact", "question", "passage"))
+        if category == "exact":
+            query = rng.choice([key] + aliases)
+        elif category == "question":
+            query = rng.choice(QUESTION_TEMPLATES).format(key.lower())
+        else:
+            passage = rng.choice(split_passages(answer))
+            words = BULLET_PATTERN.sub("", passage).split()
+            start = rng.randint(0, max(0, len(words) - 8))
+            query = " ".join(words[start:start + rng.randint(5, 10)]).lower()
+        queries.append({"query": query, "expected": key, "category": category})
+    if os.path.exists(real_queries):
+        with open(real_queries, encoding="utf-8") as lines:
+            records = [json.loads(line) for line in lines if line.strip()]
+        queries += [record for record in records if record["expected"] is None]
+    return queries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic knowledge base shaped like the real one.")
+    parser.add_argument("--passages", type=int, default=10_000, help="passages to generate")
+    parser.add_argument("--output", required=True, help="KB file to write (JSON Lines)")
+    parser.add_argument("--queries", type=int, default=300, help="labelled queries to write next to it")
+    parser.add_argument("--queries-output", help="query set path (default: <output>.queries.jsonl)")
+    parser.add_argument("--source", default=KB_DATA_PATH, help="real KB to model")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+    model = SourceModel(load_knowledge_base(args.source))
+    # Only a reservoir of entries is kept for the query sample, so 1M passages need not fit in memory.
+    reservoir, entries, keys = [], 0, 0
+    with open(args.output, "w", encoding="utf-8") as kb_file:
+        for key, answer, aliases in generate(model, args.passages, rng):
+            kb_file.write(json.dumps({"key": key, "answer": answer}, ensure_ascii=False) + "\n")
+            for alias in aliases:
+                kb_file.write(json.dumps({"key": alias, "alias_of": key}, ensure_ascii=False) + "\n")
+            keys += 1 + len(aliases)
+            entries += 1
+            if len(reservoir) < args.queries:
+                reservoir.append((key, answer, aliases))
+            else:
+                slot = rng.randrange(entries)
+                if slot < args.queries:
+                    reservoir[slot] = (key, answer, aliases)
+
+    queries_output = args.queries_output or os.path.splitext(args.output)[0] + ".queries.jsonl"
+    with open(queries_output, "w", encoding="utf-8") as query_file:
+        for record in sample_queries(reservoir, args.queries, rng):
+            query_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+    # A progress note, not output: benchmarks.kb_scale --json calls this with stdout as its report.
+    print(f"Wrote {args.passages} passages in {entries} answers ({keys} keys) to {args.output} "
+          f"and {queries_output} in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Knowledge base retrieval for the GovFocus chatbot: NLP preprocessing, the shared KB index,
+ranking and search, behind a RetrievalEngine. Nothing in this package imports Streamlit.
+
+The names below are loaded on first access, so importing the package stays in the milliseconds;
+spaCy is only imported when an index is actually built or queried.
+"""
+import importlib
+
+_EXPORTS = {
+    "answer_query": ".api",
+    "make_api_app": ".api",
+    "RetrievalEngine": ".engine",
+    "get_engine": ".engine",
+    "get_response_from_kb": ".engine",
+    "get_top_k_from_kb": ".engine",
+    "start_kb_watcher": ".engine",
+    "KnowledgeBaseIndex": ".index",
+    "get_kb_index": ".index",
+    "kb_content_hash": ".index",
+    "update_kb_index": ".index",
+    "match_intent": ".intents",
+    "small_talk_response": ".intents",
+    "format_response_text": ".nlp",
+    "load_nlp_pipeline": ".nlp",
+    "preprocess_text_for_matching": ".nlp",
+    "preprocess_texts_for_matching": ".nlp",
+    "record_session": ".metrics",
+    "render_metrics": ".metrics",
+    "start_metrics_server": ".metrics",
+    "format_did_you_mean": ".search",
+    "TELEMETRY": ".telemetry",
+    "start_trace": ".telemetry",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,118 @@
+"""
+Approximate nearest-neighbour search over passage embeddings: an inverted-file (IVF) index in NumPy.
+
+Spherical k-means splits the vectors into n_lists clusters. A query is scored against the cluster
+centroids first, and only the rows of its n_probes closest clusters are scored exactly, so a search
+touches about n_probes / n_lists of the matrix. n_lists trades build time and recall for speed;
+n_probes trades query time for recall (n_probes = n_lists is exact search). benchmarks/ann_recall.py
+measures the trade-off against exact search.
+"""
+import numpy as np
+
+from .rankers import top_k
+
+# k-means assigns vectors to centroids this many rows at a time, bounding the rows x lists score block.
+ASSIGN_BLOCK_ROWS = 16384
+
+
+def default_n_lists(n_rows):
+    """
+    The usual IVF sizing: about 4 * sqrt(n) lists, so each holds about sqrt(n) / 4 rows.
+    """
+    return max(1, int(4 * np.sqrt(n_rows)))
+
+
+def _assign(vectors, centroids):
+    assignments = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), ASSIGN_BLOCK_ROWS):
+        block = vectors[start:start + ASSIGN_BLOCK_ROWS]
+        assignments[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return assignments
+
+
+def _normalise(vectors):
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
+
+
+def spherical_kmeans(vectors, n_lists, n_iter=10, seed=0, centroids=None):
+    """
+    Clusters L2-normalised vectors by cosine similarity. Returns (centroids, assignments).
+    Starts from centroids if given (say, those of an earlier version of the same collection),
+    otherwise from n_lists distinct rows picked at random. A cluster left empty keeps its centroid.
+    """
+    if centroids is None:
+        rng = np.random.default_rng(seed)
+        centroids = vectors[rng.choice(len(vectors), min(n_lists, len(vectors)), replace=False)]
+    centroids = np.array(centroids, dtype=np.float32)  # A copy: the loop below updates it in place.
+    for _ in range(n_iter):
+        assignments = _assign(vectors, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, vectors)
+        filled = np.bincount(assignments, minlength=len(centroids)) > 0
+        centroids[filled] = _normalise(sums[filled])
+    return centroids, _assign(vectors, centroids)
+
+
+class IvfIndex:
+    """
+    IVF index over a DenseIndex (see retrieval/semantic.py), which keeps the vectors themselves.
+    list_rows holds the dense index's row ids grouped by cluster; cluster c owns
+    list_rows[list_offsets[c]:list_offsets[c + 1]].
+    """
+    def __init__(self, dense_index, centroids, list_offsets, list_rows, n_probes):
+        self.dense_index = dense_index
+        self.centroids = centroids
+        self.list_offsets = list_offsets
+        self.list_rows = list_rows
+        self.n_probes = n_probes
+
+    @classmethod
+    def build(cls, dense_index, n_lists, n_probes, n_iter=10, centroids=None):
+        """
+        Clusters the dense index's vectors into n_lists lists (see spherical_kmeans).
+        """
+        vectors = dense_index.vectors(np.arange(len(dense_index)))
+        centroids, assignments = spherical_kmeans(vectors, n_lists, n_iter=n_iter, centroids=centroids)
+        list_rows = np.argsort(assignments, kind="stable").astype(np.int64)
+        list_offsets = np.zeros(len(centroids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignments, minlength=len(centroids)), out=list_offsets[1:])
+        return cls(dense_index, centroids.astype(np.float32), list_offsets, list_rows, n_probes)
+
+    def __len__(self):
+        return len(self.dense_index)
+
+    def search_many(self, query_vectors, n):
+        """
+        Same contract as DenseIndex.search_many: the (row_ids, scores) of the (approximately) n
+        closest rows to each query, positive similarities only.
+        """
+        empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32))
+        if not len(self) or query_vectors.shape[1] != self.centroids.shape[1]:
+            return [empty] * query_vectors.shape[0]
+        n_probes = min(self.n_probes, len(self.centroids))
+        results = []
+        for query_vector, centroid_scores in zip(query_vectors, query_vectors @ self.centroids.T):
+            probed = top_k(centroid_scores, n_probes)
+            rows = np.concatenate(
+                [self.list_rows[self.list_offsets[c]:self.list_offsets[c + 1]] for c in probed]
+            )
+            scores = self.dense_index.vectors(rows) @ query_vector
+            hits = np.flatnonzero(scores > 0)
+            best = hits[top_k(scores[hits], n)]
+            results.append((rows[best], scores[best].astype(np.float32)) if best.size else empty)
+        return results
+
+    def search(self, query_vector, n):
+        """
+        Single-query version of search_many.
+        """
+        return self.search_many(query_vector[None, :], n)[0]
+
+    def to_arrays(self):
+        return {"centroids": self.centroids, "list_offsets": self.list_offsets, "list_rows": self.list_rows}
+
+    @classmethod
+    def from_arrays(cls, arrays, dense_index, n_probes):
+        return cls(dense_index, arrays["centroids"], arrays["list_offsets"], arrays["list_rows"], n_probes)
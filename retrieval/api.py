@@ -0,0 +1,275 @@
+"""
+Headless JSON API over the shared retrieval engine, for partner apps (WhatsApp and USSD gateways
+and the like) that should not drive the Streamlit chat. Runs as its own process, on Tornado:
+
+    python -m retrieval.api --port 8502
+
+Endpoints:
+    POST /query   {"query": "...", "alternatives": 3}
+                  -> {"query", "answer", "answered", "key", "score", "alternatives": [{"key", "score"}], "small_talk"}
+    GET  /query?q=...&alternatives=3                     the same, for quick checks from a browser or curl
+    POST /batch   {"queries": ["...", ...], "alternatives": 3}  -> {"results": [one /query result per query]}
+    GET  /health  -> {"status": "ok", "keys": ...}
+    GET  /metrics the Prometheus metrics of retrieval/metrics.py
+
+Answers follow the chat's order: small talk, then the KB (key lookup, then search). answer is null
+when no match clears the threshold; key and score are then those of the best near miss. A batch
+runs its small talk and key lookups one by one and ranks the rest in one nlp.pipe batch, without
+the answer cache or the hybrid latency budgets; ranked queries count in /metrics under path "batch".
+
+Queries run on API_WORKERS threads, off the event loop, so slow ones never stall other
+connections. Connections are kept alive between requests (for API_IDLE_TIMEOUT seconds idle), and
+once API_MAX_IN_FLIGHT requests are running or waiting for a worker, new ones get a 503 with
+Retry-After rather than a growing queue. The KB hot-reload watcher runs here too.
+"""
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import tornado.log
+import tornado.web
+
+from .config import (
+    API_HOST, API_IDLE_TIMEOUT, API_MAX_BATCH, API_MAX_IN_FLIGHT, API_MAX_QUERY_CHARS, API_PORT, API_WORKERS
+)
+from .engine import current_engine, get_engine, start_kb_watcher
+from .intents import small_talk_response
+from .metrics import render_metrics
+from .nlp import load_nlp_pipeline
+from .telemetry import TELEMETRY, start_trace
+
+# Near-miss matches reported with each answer unless the request asks for another number.
+DEFAULT_ALTERNATIVES = 3
+MAX_ALTERNATIVES = 10
+
+
+def _result(query, answer, matches, small_talk=False):
+    best = matches[0] if matches else None
+    return {
+        "query": query,
+        "answer": answer,
+        "answered": answer is not None,
+        "key": best[0] if best else None,
+        "score": round(float(best[1]), 4) if best else None,
+        "alternatives": [{"key": key, "score": round(float(score), 4)} for key, score, _ in matches[1:]],
+        "small_talk": small_talk,
+    }
+
+
+def answer_query(query, alternatives=DEFAULT_ALTERNATIVES, engine=None):
+    """
+    Answers one query as the chat would and returns its /query result dict. Traced like a chat message.
+    """
+    engine = engine or get_engine()
+    trace = start_trace()
+    with trace.stage("small_talk"):
+        small_talk = small_talk_response(query)
+    if small_talk:
+        trace.annotate(path="small_talk")
+        trace.finish()
+        return _result(query, small_talk, [], small_talk=True)
+    answer, matches = engine.respond(query, k=1 + alternatives, trace=trace)
+    trace.finish()
+    return _result(query, answer, matches)
+
+
+def answer_queries(queries, alternatives=DEFAULT_ALTERNATIVES, engine=None):
+    """
+    Answers a list of queries, in order; the ones that are not small talk go through the engine's
+    batch search (key lookup, then one ranking batch). Each query is traced like a chat message.
+    """
+    engine = engine or get_engine()
+    results = [None] * len(queries)
+    to_search, traces = [], []
+    for position, query in enumerate(queries):
+        trace = start_trace()
+        with trace.stage("small_talk"):
+            small_talk = small_talk_response(query)
+        if small_talk:
+            trace.annotate(path="small_talk")
+            trace.finish()
+            results[position] = _result(query, small_talk, [], small_talk=True)
+        else:
+            to_search.append(position)
+            traces.append(trace)
+    ranked = engine.search_batch([queries[position] for position in to_search], k=1 + alternatives, traces=traces)
+    for position, matches, trace in zip(to_search, ranked, traces):
+        trace.finish()
+        answer = matches[0][2] if engine.is_answer(matches) else None
+        results[position] = _result(queries[position], answer, matches)
+    return results
+
+
+class _Limiter:
+    """
+    Counts the requests being answered or waiting for a worker; acquire() fails once there are limit of them.
+    Only touched from the event loop thread, so it needs no lock.
+    """
+    def __init__(self, limit):
+        self.limit = limit
+        self.in_flight = 0
+
+    def acquire(self):
+        if self.in_flight >= self.limit:
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self):
+        self.in_flight -= 1
+
+
+class _JsonHandler(tornado.web.RequestHandler):
+    def initialize(self, executor, limiter):
+        self.executor = executor
+        self.limiter = limiter
+
+    def set_default_headers(self):
+        self.set_header("Content-Type", "application/json; charset=utf-8")
+
+    def write_error(self, status_code, **kwargs):
+        # send_error() clears the headers set before the error was raised, so Retry-After goes on here.
+        if status_code == 503:
+            self.set_header("Retry-After", "1")
+        error = self._reason
+        if "exc_info" in kwargs and isinstance(kwargs["exc_info"][1], tornado.web.HTTPError):
+            error = kwargs["exc_info"][1].log_message or error
+        self.finish(json.dumps({"error": error}))
+
+    def log_exception(self, typ, value, tb):
+        # Bad requests and load shedding are answered in the response; logging each would flood the log under load.
+        if not isinstance(value, tornado.web.HTTPError):
+            super().log_exception(typ, value, tb)
+
+    def json_body(self):
+        try:
+            body = json.loads(self.request.body or b"{}")
+        except ValueError:
+            raise tornado.web.HTTPError(400, "Request body is not valid JSON")
+        if not isinstance(body, dict):
+            raise tornado.web.HTTPError(400, "Request body must be a JSON object")
+        return body
+
+    def alternatives(self, value):
+        try:
+            alternatives = int(value)
+        except (TypeError, ValueError, OverflowError):  # OverflowError: JSON allows 1e400, which parses to inf.
+            raise tornado.web.HTTPError(400, "alternatives must be an integer")
+        return max(0, min(alternatives, MAX_ALTERNATIVES))
+
+    def checked_query(self, query):
+        if not isinstance(query, str) or not query.strip():
+            raise tornado.web.HTTPError(400, "Each query must be a non-empty string")
+        if len(query) > API_MAX_QUERY_CHARS:
+            raise tornado.web.HTTPError(400, f"Queries are limited to {API_MAX_QUERY_CHARS} characters")
+        return query.strip()
+
+    async def run(self, function, *args):
+        # Runs function on a worker thread and writes its result, or a 503 if the server is at its limit.
+        if not self.limiter.acquire():
+            TELEMETRY.count("api.rejected")
+            raise tornado.web.HTTPError(503, "Too many requests in flight, retry shortly")
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+        finally:
+            self.limiter.release()
+        self.finish(json.dumps(result, ensure_ascii=False))
+
+
+class QueryHandler(_JsonHandler):
+    async def get(self):
+        query = self.checked_query(self.get_query_argument("q", ""))
+        await self.run(answer_query, query, self.alternatives(self.get_query_argument("alternatives", DEFAULT_ALTERNATIVES)))
+
+    async def post(self):
+        body = self.json_body()
+        query = self.checked_query(body.get("query"))
+        await self.run(answer_query, query, self.alternatives(body.get("alternatives", DEFAULT_ALTERNATIVES)))
+
+
+class BatchHandler(_JsonHandler):
+    async def post(self):
+        body = self.json_body()
+        queries = body.get("queries")
+        if not isinstance(queries, list) or not queries:
+            raise tornado.web.HTTPError(400, "queries must be a non-empty list of strings")
+        if len(queries) > API_MAX_BATCH:
+            raise tornado.web.HTTPError(400, f"Batches are limited to {API_MAX_BATCH} queries")
+        queries = [self.checked_query(query) for query in queries]
+        alternatives = self.alternatives(body.get("alternatives", DEFAULT_ALTERNATIVES))
+        await self.run(lambda: {"results": answer_queries(queries, alternatives)})
+
+
+class HealthHandler(_JsonHandler):
+    def get(self):
+        # serve() builds the engine before listening; never build one here, on the event loop.
+        engine = current_engine()
+        if engine is None:
+            raise tornado.web.HTTPError(503, "The knowledge base is still loading")
+        self.finish(json.dumps({"status": "ok", "keys": len(engine.kb_index), "mode": engine.retrieval_mode}))
+
+
+class MetricsHandler(tornado.web.RequestHandler):
+    def get(self):
+        self.set_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.finish(render_metrics())
+
+
+def _log_request(handler):
+    # Only server errors reach the log; request counts and latencies are in /metrics.
+    if handler.get_status() >= 500 and handler.get_status() != 503:
+        tornado.log.access_log.error("%d %s %.2fms", handler.get_status(), handler._request_summary(),
+                                     1000 * handler.request.request_time())
+
+
+def make_api_app(workers=API_WORKERS, max_in_flight=API_MAX_IN_FLIGHT):
+    """
+    Returns the Tornado application serving the API, with its own pool of worker threads.
+    """
+    handler_settings = {
+        "executor": ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api-query"),
+        "limiter": _Limiter(max_in_flight),
+    }
+    return tornado.web.Application([
+        (r"/query", QueryHandler, handler_settings),
+        (r"/batch", BatchHandler, handler_settings),
+        (r"/health", HealthHandler, handler_settings),
+        (r"/metrics", MetricsHandler),
+    ], log_function=_log_request)
+
+
+async def serve(host=API_HOST, port=API_PORT, workers=API_WORKERS, max_in_flight=API_MAX_IN_FLIGHT):
+    """
+    Builds the shared engine, starts the KB watcher and serves the API until cancelled.
+    """
+    started = time.perf_counter()
+    # Load the index and the spaCy pipeline before listening, so no request waits for them.
+    engine = get_engine()
+    load_nlp_pipeline()
+    start_kb_watcher()
+    make_api_app(workers, max_in_flight).listen(
+        port, address=host, idle_connection_timeout=API_IDLE_TIMEOUT, max_body_size=1024 * 1024
+    )
+    print(f"Serving {len(engine.kb_index)} KB keys ({engine.retrieval_mode}) on http://{host}:{port} "
+          f"after {time.perf_counter() - started:.1f}s")
+    await asyncio.Event().wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the knowledge base as a JSON API.")
+    parser.add_argument("--host", default=API_HOST)
+    parser.add_argument("--port", type=int, default=API_PORT)
+    parser.add_argument("--workers", type=int, default=API_WORKERS, help="threads answering queries")
+    parser.add_argument("--max-in-flight", type=int, default=API_MAX_IN_FLIGHT,
+                        help="requests running or queued before new ones get a 503")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.max_in_flight))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Binary index artifact: named NumPy arrays plus JSON metadata in one file, laid out so the
+arrays can be memory-mapped. Every worker process that opens the same artifact shares one
+physical copy of it through the OS page cache.
+
+Layout: MAGIC, the header length as a little-endian uint64, the JSON header, then each array's
+raw bytes starting on a 64-byte boundary. The header records every array's dtype, shape and
+offset from the start of the data section.
+"""
+import json
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+MAGIC = b"GFKBIDX1"
+ALIGNMENT = 64
+
+
+def _aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def write_artifact(path, arrays, metadata):
+    """
+    Writes arrays ({name: ndarray}) and JSON-serialisable metadata to path.
+    The file is written next to path and renamed into place, so readers never see a partial artifact.
+    """
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        arrays[name] = array
+        offset = _aligned(offset)
+        layout[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset += array.nbytes
+    header = json.dumps({"metadata": metadata, "arrays": layout}).encode("utf-8")
+    data_start = _aligned(len(MAGIC) + 8 + len(header))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    file_descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=".kb_index_", suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as artifact_file:
+            artifact_file.write(MAGIC)
+            artifact_file.write(struct.pack("<Q", len(header)))
+            artifact_file.write(header)
+            for name, array in arrays.items():
+                artifact_file.seek(data_start + layout[name]["offset"])
+                artifact_file.write(array.tobytes())
+        os.chmod(temp_path, 0o644)  # mkstemp creates owner-only files; other workers need to read it.
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _read_header(artifact_file, path):
+    if artifact_file.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"{path} is not a knowledge base index artifact")
+    (header_length,) = struct.unpack("<Q", artifact_file.read(8))
+    header = json.loads(artifact_file.read(header_length))
+    return header, _aligned(len(MAGIC) + 8 + header_length)
+
+
+def read_artifact_metadata(path):
+    """
+    Returns only the metadata of an artifact, without mapping its arrays.
+    """
+    with open(path, "rb") as artifact_file:
+        return _read_header(artifact_file, path)[0]["metadata"]
+
+
+def open_artifact(path):
+    """
+    Memory-maps an artifact read-only. Returns (metadata, {name: ndarray}); the arrays are views
+    into the mapping, so nothing is copied until it is read.
+    """
+    with open(path, "rb") as artifact_file:
+        header, data_start = _read_header(artifact_file, path)
+    mapping = np.memmap(path, dtype=np.uint8, mode="r")
+    arrays = {}
+    for name, spec in header["arrays"].items():
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"], dtype=np.int64))
+        start = data_start + spec["offset"]
+        arrays[name] = mapping[start:start + count * dtype.itemsize].view(dtype).reshape(spec["shape"])
+    return header["metadata"], arrays
+
+
+def load_or_build_artifact(path, is_current, load, build):
+    """
+    Returns load(path) if the artifact at path exists and is_current(its metadata); otherwise returns
+    build(), after saving it to path (with its save method) for the next process to map. A missing,
+    stale or unreadable artifact is rebuilt; path None means there is no artifact to read or write.
+    """
+    if path is not None:
+        try:
+            if is_current(read_artifact_metadata(path)):
+                return load(path)
+        except (OSError, ValueError, KeyError):
+            pass  # Missing, stale or unreadable artifact: rebuild it below.
+    built = build()
+    if path is not None:
+        try:
+            built.save(path)
+        except OSError:
+            pass  # A read-only deployment can still serve the in-memory index.
+    return built
+
+
+class TextTable:
+    """
+    Read-only sequence of strings kept as one UTF-8 blob plus an offsets array, either of which
+    may be memory-mapped. Strings are decoded on access.
+    """
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        self.offsets = offsets
+
+    @classmethod
+    def pack(cls, strings):
+        encoded = [string.encode("utf-8") for string in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(chunk) for chunk in encoded], out=offsets[1:])
+        return cls(np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        return self.blob[self.offsets[i]:self.offsets[i + 1]].tobytes().decode("utf-8")
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
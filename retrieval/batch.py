@@ -0,0 +1,56 @@
+"""
+Batch query API for offline evaluation and traffic replay, independent of the Streamlit runtime.
+
+Usage:
+    python -m retrieval.batch queries.txt > results.jsonl
+    cat queries.txt | python -m retrieval.batch --k 5 --threshold 0.25
+
+Each input line is one query; each output line is a JSON object with the query, whether it
+would have been answered, and its ranked matches. Queries are matched as the chat matches them,
+key lookup first, so replayed scores are the ones live traffic gets.
+"""
+import argparse
+import itertools
+import json
+import sys
+
+from .config import NLP_BATCH_SIZE
+from .engine import get_engine
+
+
+def iter_search_batch(queries, k=3, batch_size=NLP_BATCH_SIZE, engine=None):
+    """
+    Ranks an iterable of queries with the shared engine (or the one given); see RetrievalEngine.iter_search_batch.
+    """
+    return (engine or get_engine()).iter_search_batch(queries, k=k, batch_size=batch_size)
+
+
+def search_batch(queries, k=3, batch_size=NLP_BATCH_SIZE, engine=None):
+    """
+    List-returning version of iter_search_batch.
+    """
+    return list(iter_search_batch(queries, k=k, batch_size=batch_size, engine=engine))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank a file of queries (one per line) against the knowledge base.")
+    parser.add_argument("queries", nargs="?", type=argparse.FileType("r", encoding="utf-8"), default=sys.stdin)
+    parser.add_argument("--k", type=int, default=3, help="matches to report per query")
+    parser.add_argument("--threshold", type=float, help="score needed to answer (default: the engine's)")
+    parser.add_argument("--batch-size", type=int, default=NLP_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    queries = (line.strip() for line in args.queries if line.strip())
+    queries, to_echo = itertools.tee(queries)
+    engine = get_engine()
+    for query, matches in zip(to_echo, iter_search_batch(queries, k=args.k, batch_size=args.batch_size, engine=engine)):
+        record = {
+            "query": query,
+            "answered": engine.is_answer(matches, args.threshold),
+            "matches": [{"key": key, "score": round(score, 4)} for key, score, _ in matches],
+        }
+        sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import threading
+
+from cachetools import TTLCache
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache with a time-to-live, for answers keyed on the processed query.
+    The least recently used entry is evicted when the cache is full, and entries expire after
+    ttl seconds. Hit and miss counts are kept for monitoring.
+    """
+    def __init__(self, maxsize, ttl):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Returns the cached value for key, or None on a miss.
+        """
+        with self._lock:
+            value = self._cache.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._cache[key] = value
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self):
+        """
+        Returns the hit/miss counters and current size as a dict.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": self._cache.currsize,
+                "maxsize": self._cache.maxsize,
+                "ttl": self._cache.ttl,
+            }
@@ -0,0 +1,54 @@
+"""
+Compiles a knowledge base data file into a memory-mappable index artifact.
+
+Usage:
+    python -m retrieval.compile                      # data/knowledge_base.jsonl, configured ranker
+    python -m retrieval.compile kb.parquet --ranker bm25 --output kb.bm25.idx
+    python -m retrieval.compile --semantic           # also embed the KB (and build its ANN index)
+
+The app compiles the artifact itself when it is missing or stale, but running this at deploy
+time means no worker ever pays for the build on its first request.
+"""
+import argparse
+import time
+
+from .config import KB_DATA_PATH, RANKER_NAME, kb_index_path
+from .index import KnowledgeBaseIndex, kb_content_hash
+from .kb_data import load_knowledge_base
+from .rankers import RANKERS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile a knowledge base data file into an index artifact.")
+    parser.add_argument("kb_path", nargs="?", default=KB_DATA_PATH, help="JSON Lines or Parquet KB file")
+    parser.add_argument("--ranker", default=RANKER_NAME, choices=sorted(RANKERS))
+    parser.add_argument("--output", help="artifact path (default: next to the KB file)")
+    parser.add_argument("--semantic", action="store_true", help="also compile the embeddings for semantic search")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        knowledge_base = load_knowledge_base(args.kb_path)
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"Cannot compile {args.kb_path}: {e}")
+    index = KnowledgeBaseIndex(knowledge_base, kb_content_hash(knowledge_base), args.ranker)
+    output = args.output or kb_index_path(args.kb_path, args.ranker)
+    index.save(output)
+    print(f"Compiled {len(index)} keys ({len(index.bodies)} distinct answers, {len(index.passage_index.passages)} passages) "
+          f"into {output} in {time.perf_counter() - started:.2f}s")
+
+    if args.semantic:
+        from .semantic import SemanticIndex, embedding_model_name  # Deferred: only needed with --semantic.
+
+        started = time.perf_counter()
+        semantic_index = SemanticIndex.build(index, embedding_model_name())
+        semantic_output = kb_index_path(args.kb_path, "semantic")
+        semantic_index.save(semantic_output)
+        ann = semantic_index.passage_ann
+        ann_note = f", IVF index with {len(ann.centroids)} lists" if ann is not None else ""
+        print(f"Compiled {semantic_index.model_name} embeddings{ann_note} into {semantic_output} "
+              f"in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import os
+
+# Ranking engine for both the key and body fields: "tfidf" (cosine similarity) or "bm25".
+RANKER_NAME = os.environ.get("GOVFOCUS_RANKER", "tfidf")
+# Both rankers score in [0, 1], but BM25 scores run lower, so compare hit rates before reusing a threshold.
+SIMILARITY_THRESHOLD = float(os.environ.get("GOVFOCUS_SIMILARITY_THRESHOLD", "0.3"))
+
+# "lexical" scores lemma overlap with the ranker above; "semantic" compares text embeddings
+# (see retrieval/semantic.py), which also matches paraphrases that share no words; "hybrid" runs both.
+RETRIEVAL_MODE = os.environ.get("GOVFOCUS_RETRIEVAL_MODE", "lexical")
+# The spaCy pipeline (installed package name or local directory) whose vectors embed texts in semantic
+# mode. Empty means the matching pipeline itself; a model with static vectors (en_core_web_md/lg) does better.
+EMBEDDING_MODEL = os.environ.get("GOVFOCUS_EMBEDDING_MODEL", "")
+# "float32", or "int8" to store the embedding matrix quantised at a quarter of the size.
+EMBEDDING_DTYPE = os.environ.get("GOVFOCUS_EMBEDDING_DTYPE", "float32")
+# Cosine similarities between averaged word vectors run high, so semantic mode needs its own threshold;
+# calibrate it for the embedding model in use.
+SEMANTIC_SIMILARITY_THRESHOLD = float(os.environ.get("GOVFOCUS_SEMANTIC_SIMILARITY_THRESHOLD", "0.7"))
+# How many of the closest keys and passages semantic search passes on to field merging.
+SEMANTIC_CANDIDATES = 50
+
+# Past ANN_MIN_PASSAGES passages, semantic search scans an IVF index (see retrieval/ann.py) instead of every
+# passage vector. ANN_LISTS clusters (0 picks about 4 * sqrt(passages)) are built with the semantic index;
+# each query scans the ANN_PROBES closest ones, so raising it buys recall with latency.
+ANN_MIN_PASSAGES = int(os.environ.get("GOVFOCUS_ANN_MIN_PASSAGES", "20000"))
+ANN_LISTS = int(os.environ.get("GOVFOCUS_ANN_LISTS", "0"))
+ANN_PROBES = int(os.environ.get("GOVFOCUS_ANN_PROBES", "16"))
+
+# Hybrid mode fuses the lexical and semantic rankings by reciprocal rank ("rrf") or by a weighted sum
+# of scores ("weighted", giving the semantic side HYBRID_SEMANTIC_WEIGHT).
+HYBRID_FUSION = os.environ.get("GOVFOCUS_HYBRID_FUSION", "rrf")
+HYBRID_SEMANTIC_WEIGHT = float(os.environ.get("GOVFOCUS_HYBRID_SEMANTIC_WEIGHT", "0.5"))
+# The usual constant in 1 / (RRF_K + rank); it keeps one list's top hit from outweighing agreement.
+RRF_K = 60
+# Latency budgets, in seconds, for the stages of a hybrid query. The semantic side (embedding, then the
+# vector search) runs on a thread pool while the lexical side runs on the caller's thread; if it is not
+# done within its budgets the query is answered from the lexical result alone. If the lexical stage
+# itself overruns, the query is already late and takes only what is ready.
+HYBRID_LEXICAL_BUDGET = float(os.environ.get("GOVFOCUS_HYBRID_LEXICAL_BUDGET", "0.1"))
+HYBRID_EMBED_BUDGET = float(os.environ.get("GOVFOCUS_HYBRID_EMBED_BUDGET", "0.15"))
+HYBRID_SEARCH_BUDGET = float(os.environ.get("GOVFOCUS_HYBRID_SEARCH_BUDGET", "0.1"))
+HYBRID_WORKERS = int(os.environ.get("GOVFOCUS_HYBRID_WORKERS", "4"))
+
+# Key matches are trusted more than a passage that merely mentions the query terms,
+# so body scores are discounted before the two fields are compared.
+KEY_FIELD_WEIGHT = 1.0
+BODY_FIELD_WEIGHT = 0.8
+
+# Queries that are a KB key up to case, punctuation and filler words are answered from a hash table before
+# any NLP runs (see retrieval/lookup.py), and near-misses with up to KEY_LOOKUP_MAX_EDITS typos per misspelt word
+# (0: off).
+KEY_LOOKUP = os.environ.get("GOVFOCUS_KEY_LOOKUP", "1") == "1"
+KEY_LOOKUP_MAX_EDITS = int(os.environ.get("GOVFOCUS_KEY_LOOKUP_MAX_EDITS", "2"))
+
+# Below-threshold matches scoring at least this much are offered as "did you mean" suggestions. Semantic
+# scores need their own floor, like the answer threshold: even unrelated texts score around 0.3 there.
+SUGGESTION_THRESHOLD = 0.15
+SEMANTIC_SUGGESTION_THRESHOLD = float(os.environ.get("GOVFOCUS_SEMANTIC_SUGGESTION_THRESHOLD", "0.5"))
+
+# "lookup" lemmatizes queries of up to LEMMA_LOOKUP_MAX_TOKENS tokens from a table of the lemmas spaCy gave the
+# KB's own words, running only the tokenizer; queries with other words, and "spacy", run the whole pipeline.
+QUERY_NORMALIZER = os.environ.get("GOVFOCUS_QUERY_NORMALIZER", "lookup")
+LEMMA_LOOKUP_MAX_TOKENS = int(os.environ.get("GOVFOCUS_LEMMA_LOOKUP_MAX_TOKENS", "12"))
+
+# How many texts spaCy processes per nlp.pipe batch when preprocessing in bulk.
+NLP_BATCH_SIZE = int(os.environ.get("GOVFOCUS_NLP_BATCH_SIZE", "256"))
+
+# Formatted answers are cached per processed query; the cache belongs to the engine, so a KB change drops it.
+ANSWER_CACHE_SIZE = int(os.environ.get("GOVFOCUS_ANSWER_CACHE_SIZE", "1024"))
+ANSWER_CACHE_TTL = float(os.environ.get("GOVFOCUS_ANSWER_CACHE_TTL", "3600"))
+
+# Per-stage query timings go into in-process histograms (see retrieval/telemetry.py); this share of queries is
+# also written, with its matched key and score, as a JSON line to TELEMETRY_LOG_PATH (stderr if empty).
+TELEMETRY_ENABLED = os.environ.get("GOVFOCUS_TELEMETRY", "1") == "1"
+TELEMETRY_SAMPLE_RATE = float(os.environ.get("GOVFOCUS_TELEMETRY_SAMPLE_RATE", "0.01"))
+TELEMETRY_LOG_PATH = os.environ.get("GOVFOCUS_TELEMETRY_LOG_PATH", "")
+
+# The Prometheus exporter (see retrieval/metrics.py) listens on METRICS_HOST:METRICS_PORT; 0 leaves it off.
+METRICS_PORT = int(os.environ.get("GOVFOCUS_METRICS_PORT", "0"))
+METRICS_HOST = os.environ.get("GOVFOCUS_METRICS_HOST", "127.0.0.1")
+# A chat session counts as active for this many seconds after its last message or rerun.
+ACTIVE_SESSION_WINDOW = float(os.environ.get("GOVFOCUS_ACTIVE_SESSION_WINDOW", "1800"))
+
+# The headless JSON API (see retrieval/api.py) listens on API_HOST:API_PORT. API_WORKERS threads answer
+# queries; requests beyond API_MAX_IN_FLIGHT (running or waiting for a worker) get a 503 instead of queueing.
+API_HOST = os.environ.get("GOVFOCUS_API_HOST", "127.0.0.1")
+API_PORT = int(os.environ.get("GOVFOCUS_API_PORT", "8502"))
+API_WORKERS = int(os.environ.get("GOVFOCUS_API_WORKERS", "4"))
+API_MAX_IN_FLIGHT = int(os.environ.get("GOVFOCUS_API_MAX_IN_FLIGHT", "64"))
+API_MAX_BATCH = int(os.environ.get("GOVFOCUS_API_MAX_BATCH", "100"))
+API_MAX_QUERY_CHARS = int(os.environ.get("GOVFOCUS_API_MAX_QUERY_CHARS", "1000"))
+# Seconds an idle keep-alive connection is held open.
+API_IDLE_TIMEOUT = float(os.environ.get("GOVFOCUS_API_IDLE_TIMEOUT", "60"))
+
+# The knowledge base data file (JSON Lines or Parquet) and where its compiled index artifacts go.
+# An artifact is specific to one ranker, so each ranker gets its own file next to the data.
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+KB_DATA_PATH = os.environ.get("GOVFOCUS_KB_PATH", os.path.join(PROJECT_ROOT, "data", "knowledge_base.jsonl"))
+KB_INDEX_DIR = os.environ.get("GOVFOCUS_KB_INDEX_DIR")
+# How often, in seconds, the watcher thread checks the data file for edits; 0 turns hot reloading off.
+KB_RELOAD_INTERVAL = float(os.environ.get("GOVFOCUS_KB_RELOAD_INTERVAL", "2.0"))
+
+
+def kb_index_path(kb_path, ranker_name):
+    """
+    Returns the artifact path for the KB data file at kb_path under the given ranker.
+    """
+    base_name = os.path.splitext(os.path.basename(kb_path))[0]
+    directory = KB_INDEX_DIR or os.path.dirname(os.path.abspath(kb_path))
+    return os.path.join(directory, f"{base_name}.{ranker_name}.idx")
@@ -0,0 +1,436 @@
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+import numpy as np
+
+from .cache import QueryCache
+from .config import (
+    ANSWER_CACHE_SIZE, ANSWER_CACHE_TTL, HYBRID_EMBED_BUDGET, HYBRID_LEXICAL_BUDGET, HYBRID_SEARCH_BUDGET,
+    HYBRID_WORKERS, KB_RELOAD_INTERVAL, KEY_LOOKUP, NLP_BATCH_SIZE, QUERY_NORMALIZER, RANKER_NAME, RETRIEVAL_MODE,
+    SEMANTIC_CANDIDATES, SEMANTIC_SIMILARITY_THRESHOLD, SEMANTIC_SUGGESTION_THRESHOLD, SIMILARITY_THRESHOLD,
+    SUGGESTION_THRESHOLD
+)
+from .index import build_changed_kb_index, get_kb_index, install_kb_index
+from .lookup import KeyLookup
+from .nlp import embed_text, embed_texts, preprocess_text_for_matching, preprocess_texts_for_matching
+from .search import (
+    fuse_candidates, lexical_query_weights, merge_fields, rank_kb_entries, rank_kb_entries_semantic, top_k_matches
+)
+from .telemetry import NULL_TRACE, log_event, start_trace
+
+RETRIEVAL_MODES = ("lexical", "semantic", "hybrid")
+QUERY_NORMALIZERS = ("lookup", "spacy")
+
+_NO_CANDIDATES = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32), np.empty(0, dtype=np.int64))
+
+
+def _sparse_row(score_matrix, row):
+    start, end = score_matrix.indptr[row], score_matrix.indptr[row + 1]
+    return score_matrix.indices[start:end].astype(np.int64), score_matrix.data[start:end]
+
+
+class RetrievalEngine:
+    """
+    The retrieval fast path shared by the Streamlit UI, headless workers and benchmarks:
+    one KB index plus the matching settings, with single-query, top-k and batch search.
+    An engine never changes its index; build a new engine to pick up a new KB (which also
+    starts a fresh answer cache).
+
+    retrieval_mode is "lexical" (the key and passage rankers), "semantic" (embedding search,
+    see retrieval/semantic.py) or "hybrid" (both, fused; see _rank_hybrid). The default threshold
+    depends on it, as does the "did you mean" suggestion_threshold: semantic scores run higher,
+    and hybrid scores are on the lexical scale.
+    Chat answers (respond, get_response) first try the key lookup fast path (see lookup()).
+    query_normalizer "lookup" lemmatizes short queries from the index's lemma table instead of
+    running spaCy (see nlp.preprocess_text_for_matching); "spacy" always runs the pipeline.
+    """
+    def __init__(self, kb_index, similarity_threshold=None, answer_cache_size=ANSWER_CACHE_SIZE,
+                 answer_cache_ttl=ANSWER_CACHE_TTL, retrieval_mode=RETRIEVAL_MODE, query_normalizer=QUERY_NORMALIZER):
+        if retrieval_mode not in RETRIEVAL_MODES:
+            raise ValueError(f"Unknown retrieval mode '{retrieval_mode}'. Choose one of: {', '.join(RETRIEVAL_MODES)}")
+        if query_normalizer not in QUERY_NORMALIZERS:
+            raise ValueError(f"Unknown query normalizer '{query_normalizer}'. Choose lookup or spacy")
+        self.kb_index = kb_index
+        self.lemma_table = kb_index.lemma_table if query_normalizer == "lookup" else None
+        self.retrieval_mode = retrieval_mode
+        if similarity_threshold is None:
+            similarity_threshold = SEMANTIC_SIMILARITY_THRESHOLD if retrieval_mode == "semantic" else SIMILARITY_THRESHOLD
+        self.similarity_threshold = similarity_threshold
+        # The score a near miss needs to be offered as a "did you mean" (see search.format_did_you_mean).
+        self.suggestion_threshold = (
+            SEMANTIC_SUGGESTION_THRESHOLD if retrieval_mode == "semantic" else SUGGESTION_THRESHOLD
+        )
+        self.answer_cache = QueryCache(answer_cache_size, answer_cache_ttl)
+        self.key_lookup = KeyLookup(kb_index.keys, kb_index.key_bodies) if KEY_LOOKUP else None
+        self.semantic_index = None
+        if retrieval_mode != "lexical":
+            from .semantic import get_semantic_index  # Deferred: only semantic and hybrid modes need it.
+
+            self.semantic_index = get_semantic_index(kb_index)
+            # Load and run the embedding model now; the first query would otherwise blow the hybrid budget.
+            embed_text("warm up")
+        # Hybrid queries answered from the lexical side alone because the semantic side ran out of time.
+        self.semantic_timeouts = 0
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def from_knowledge_base(cls, knowledge_base=None, ranker_name=RANKER_NAME, **settings):
+        """
+        Builds an engine over the shared index for knowledge_base (by default the KB data file).
+        """
+        return cls(get_kb_index(knowledge_base, ranker_name), **settings)
+
+    def top_k(self, query, k=3, trace=NULL_TRACE):
+        """
+        Returns up to k (key, score, passage) tuples for the query, best first.
+        passage is the matched answer text, already formatted: the whole answer for a key match,
+        the best passage for a body match. trace (see retrieval/telemetry.py) times the stages.
+        """
+        with trace.stage("preprocess"):
+            processed_query = preprocess_text_for_matching(query, self.lemma_table)
+        return self._top_k_processed(query, processed_query, k, trace)[0]
+
+    def _top_k_processed(self, query, processed_user_query_str, k, trace):
+        # Returns (matches, complete); complete is False if a hybrid query ran out of time for its
+        # semantic side, so its matches stand in for this once and are not worth caching.
+        if not processed_user_query_str.strip():
+            return [], True  # No meaningful words in the processed query.
+
+        if self.retrieval_mode == "hybrid":
+            with trace.stage("similarity"):
+                *candidates, fused, complete = self._rank_hybrid(query, processed_user_query_str, trace)
+            with trace.stage("format"):
+                return top_k_matches(self.kb_index, *candidates, k, order_by=fused), complete
+        if self.retrieval_mode == "semantic":
+            with trace.stage("vectorize"):
+                query_vector = embed_text(query)
+            with trace.stage("similarity"):
+                candidates = rank_kb_entries_semantic(self.kb_index, self.semantic_index, query_vector)
+        else:
+            with trace.stage("vectorize"):
+                query_weights = lexical_query_weights(self.kb_index, processed_user_query_str)
+            with trace.stage("similarity"):
+                candidates = rank_kb_entries(self.kb_index, processed_user_query_str, query_weights)
+        with trace.stage("format"):
+            return top_k_matches(self.kb_index, *candidates, k), True
+
+    def _rank_hybrid(self, query, processed_query, trace=NULL_TRACE):
+        """
+        Runs the semantic search on the shared thread pool while the lexical search runs here, then
+        fuses the two (see fuse_candidates). The semantic side gets HYBRID_EMBED_BUDGET +
+        HYBRID_SEARCH_BUDGET from submission, or nothing more once the lexical side has overrun
+        HYBRID_LEXICAL_BUDGET; past that, or if it fails (which is logged), the lexical result is
+        used alone, so a slow or broken embedder never holds up an answer. The embedding is traced
+        as the "vectorize" stage, in parallel with the lexical search inside the caller's "similarity" stage.
+        Returns the fused candidates followed by whether the semantic side made it in time and succeeded.
+        """
+        started = time.perf_counter()
+        semantic_future = _search_pool().submit(self._rank_semantic_within_budget, query, started, trace)
+        lexical = rank_kb_entries(self.kb_index, processed_query)
+        elapsed = time.perf_counter() - started
+        if elapsed > HYBRID_LEXICAL_BUDGET:
+            timeout = 0
+        else:
+            timeout = max(0.0, HYBRID_EMBED_BUDGET + HYBRID_SEARCH_BUDGET - elapsed)
+        try:
+            semantic = semantic_future.result(timeout=timeout)
+        except TimeoutError:
+            # Cancelled if still queued behind slower queries, so it never runs for nothing.
+            semantic_future.cancel()
+            semantic = None
+        except Exception as e:
+            # A failing embedder or vector search costs this query its semantic side, not its answer.
+            log_event("semantic_search_failed", error=f"{type(e).__name__}: {e}")
+            trace.annotate(semantic_error=True)
+            return (*fuse_candidates(lexical, _NO_CANDIDATES), False)
+        if semantic is None:
+            with self._stats_lock:
+                self.semantic_timeouts += 1
+            trace.annotate(semantic_timeout=True)
+            return (*fuse_candidates(lexical, _NO_CANDIDATES), False)
+        return (*fuse_candidates(lexical, semantic), True)
+
+    def _rank_semantic_within_budget(self, query, started, trace):
+        if time.perf_counter() - started > HYBRID_EMBED_BUDGET:
+            return None  # Waited out its budget in the pool's queue: the caller has given up on it.
+        with trace.stage("vectorize"):
+            query_vector = embed_text(query)
+        if time.perf_counter() - started > HYBRID_EMBED_BUDGET:
+            return None  # Over budget: the caller is falling back to lexical, so skip the search.
+        return rank_kb_entries_semantic(self.kb_index, self.semantic_index, query_vector)
+
+    def lookup(self, query):
+        """
+        Returns the (key, score, passage) match for a query that names a KB key outright or within a
+        typo or two (see retrieval/lookup.py), or None. Runs no NLP, so it costs microseconds.
+        """
+        found = self.key_lookup.find(query) if self.key_lookup is not None else None
+        if found is None:
+            return None
+        row, score = found
+        return self.kb_index.keys[row], score, self.kb_index.formatted_bodies[self.kb_index.key_bodies[row]]
+
+    def respond(self, query, k=1, trace=None):
+        """
+        Returns (answer, matches) for a chat message: the formatted answer text, or None if no
+        match clears the threshold, and the top-k matches behind it.
+        Results are cached on the processed query, so rephrasings that normalise to the same
+        lemmas skip ranking. A key lookup hit is answered before either; it heads the matches,
+        and for k > 1 the search (cached as above) fills in the runners-up.
+        The stages are timed into trace, which the caller finishes (say, after streaming the
+        answer); without one the engine traces and finishes the query itself.
+        """
+        if trace is None:
+            trace = start_trace()
+            result = self._respond(query, k, trace)
+            trace.finish()
+            return result
+        return self._respond(query, k, trace)
+
+    def _respond(self, query, k, trace):
+        with trace.stage("key_lookup"):
+            match = self.lookup(query)
+        if match is not None and self.is_answer([match]):
+            matches = [match]
+            if k > 1:
+                matches += [other for other in self._search(query, k, trace)[1] if other[0] != match[0]][:k - 1]
+            trace.annotate(path="key_lookup", key=match[0], score=match[1], answered=True)
+            return match[2], matches
+
+        answer, matches, path = self._search(query, k, trace)
+        if matches:
+            trace.annotate(key=matches[0][0], score=matches[0][1])
+        trace.annotate(path=path, answered=answer is not None)
+        return answer, matches
+
+    def _search(self, query, k, trace):
+        # The cached ranking behind respond(): returns (answer, matches, "cache" or "search").
+        with trace.stage("preprocess"):
+            processed_user_query_str = preprocess_text_for_matching(query, self.lemma_table)
+        cache_key = (processed_user_query_str, k)
+        cached = self.answer_cache.get(cache_key)
+        if cached is not None:
+            return (*cached, "cache")
+        matches, complete = self._top_k_processed(query, processed_user_query_str, k, trace)
+        answer = matches[0][2] if self.is_answer(matches) else None
+        if complete:
+            self.answer_cache.put(cache_key, (answer, matches))
+        return answer, matches, "search"
+
+    def is_answer(self, matches, similarity_threshold=None):
+        """
+        True if the best of the given matches clears the similarity threshold.
+        """
+        if similarity_threshold is None:
+            similarity_threshold = self.similarity_threshold
+        return bool(matches) and matches[0][1] >= similarity_threshold
+
+    def get_response(self, query, similarity_threshold=None):
+        """
+        Returns the matched answer text for the query, or None if nothing clears the threshold
+        (the engine's own unless one is passed).
+        """
+        trace = start_trace()
+        with trace.stage("key_lookup"):
+            match = self.lookup(query)
+        if match is not None and self.is_answer([match], similarity_threshold):
+            trace.annotate(path="key_lookup")
+            matches = [match]
+        else:
+            trace.annotate(path="search")
+            matches = self.top_k(query, k=1, trace=trace)
+        answered = self.is_answer(matches, similarity_threshold)
+        if matches:
+            trace.annotate(key=matches[0][0], score=matches[0][1])
+        trace.annotate(answered=answered)
+        trace.finish()
+        return matches[0][2] if answered else None
+
+    def iter_search_batch(self, queries, k=3, batch_size=NLP_BATCH_SIZE, traces=None):
+        """
+        Ranks an iterable of queries, yielding one list of (key, score, passage) tuples per query, in order.
+        As in respond(), a query that names a key is answered with it first (see lookup()), and the
+        ranking only fills in its runners-up, so replayed queries score as they would in the chat.
+        The rest are consumed batch_size at a time: each batch goes through nlp.pipe once and is scored
+        against the keys and the passages with one matrix product per field (sparse postings in
+        lexical mode, the embedding matrices in semantic mode).
+        traces, if given, holds one trace per query (see retrieval/telemetry.py); each is annotated
+        with its path ("key_lookup" or "batch") and match and timed with its batch, for the caller to finish.
+        """
+        queries = iter(queries)
+        traces = iter(traces) if traces is not None else itertools.repeat(NULL_TRACE)
+        while True:
+            batch = list(itertools.islice(queries, batch_size))
+            if not batch:
+                return
+            batch_traces = list(itertools.islice(traces, len(batch)))
+            hits = []
+            for query, trace in zip(batch, batch_traces):
+                with trace.stage("key_lookup"):
+                    match = self.lookup(query)
+                hits.append(match if match is not None and self.is_answer([match]) else None)
+            # A key hit needs the ranking only for its runners-up.
+            to_rank = [row for row, hit in enumerate(hits) if hit is None or k > 1]
+            started = time.perf_counter()
+            ranked = dict(zip(to_rank, self._rank_batch([batch[row] for row in to_rank], k, batch_size)))
+            batch_seconds = time.perf_counter() - started
+            for row, (hit, trace) in enumerate(zip(hits, batch_traces)):
+                matches = ranked.get(row, [])
+                if row in ranked:
+                    trace.record("batch_search", batch_seconds)
+                if hit is not None:
+                    matches = [hit] + [other for other in matches if other[0] != hit[0]][:k - 1]
+                trace.annotate(path="batch" if hit is None else "key_lookup")
+                if matches:
+                    trace.annotate(key=matches[0][0], score=matches[0][1])
+                trace.annotate(answered=self.is_answer(matches))
+                yield matches
+
+    def _rank_batch(self, batch, k, batch_size):
+        # The search half of iter_search_batch: a list of top-k matches per query of one batch.
+        if not batch:
+            return []
+        if self.retrieval_mode != "lexical":
+            query_vectors = embed_texts(batch, batch_size=batch_size)
+            semantic = [
+                merge_fields(self.kb_index, *key_hit, *passage_hit) for key_hit, passage_hit in zip(
+                    self.semantic_index.key_vectors.search_many(query_vectors, SEMANTIC_CANDIDATES),
+                    self.semantic_index.passage_search.search_many(query_vectors, SEMANTIC_CANDIDATES),
+                )
+            ]
+        if self.retrieval_mode != "semantic":
+            processed = preprocess_texts_for_matching(batch, batch_size=batch_size)
+            key_scores = self.kb_index.key_ranker.search_many(processed)
+            passage_scores = self.kb_index.passage_index.search_many(processed)
+            lexical = [
+                merge_fields(self.kb_index, *_sparse_row(key_scores, row), *_sparse_row(passage_scores, row))
+                for row in range(len(batch))
+            ]
+        results = []
+        for row in range(len(batch)):
+            if self.retrieval_mode == "hybrid":
+                # Offline batches have no latency budget: both sides always complete.
+                *candidates, fused = fuse_candidates(lexical[row], semantic[row])
+                results.append(top_k_matches(self.kb_index, *candidates, k, order_by=fused))
+            else:
+                candidates = semantic[row] if self.retrieval_mode == "semantic" else lexical[row]
+                results.append(top_k_matches(self.kb_index, *candidates, k))
+        return results
+
+    def search_batch(self, queries, k=3, batch_size=NLP_BATCH_SIZE, traces=None):
+        """
+        List-returning version of iter_search_batch.
+        """
+        return list(self.iter_search_batch(queries, k=k, batch_size=batch_size, traces=traces))
+
+
+# The engine shared by every session and worker thread in the process.
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine(knowledge_base=None, ranker_name=RANKER_NAME, retrieval_mode=RETRIEVAL_MODE):
+    """
+    Returns the process-wide engine, building it on first use and rebuilding it when the
+    shared KB index (see get_kb_index) or the retrieval mode changes.
+    """
+    global _engine
+    kb_index = get_kb_index(knowledge_base, ranker_name)
+    engine = _engine
+    if engine is not None and engine.kb_index is kb_index and engine.retrieval_mode == retrieval_mode:
+        return engine
+    with _engine_lock:
+        # Read the index again under the lock: the watcher installs a reloaded index and its engine
+        # together while holding it, so a mismatch seen above may already be resolved.
+        kb_index = get_kb_index(knowledge_base, ranker_name)
+        if _engine is None or _engine.kb_index is not kb_index or _engine.retrieval_mode != retrieval_mode:
+            _engine = RetrievalEngine(kb_index, retrieval_mode=retrieval_mode)
+        return _engine
+
+
+def current_engine():
+    """
+    Returns the process-wide engine if one has been built, without building it; for monitoring.
+    """
+    return _engine
+
+
+# The thread pool that runs the semantic side of hybrid queries, shared by every engine.
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _search_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=HYBRID_WORKERS, thread_name_prefix="semantic-search")
+    return _pool
+
+
+# The thread that hot-reloads the KB data file, started at most once per process.
+_watcher = None
+
+
+def start_kb_watcher(interval=KB_RELOAD_INTERVAL):
+    """
+    Starts a daemon thread that checks the KB data file every interval seconds and, when it has
+    changed, builds the new index in the background and swaps in a new shared engine.
+    Queries already running finish against the engine they started with. Does nothing if the
+    watcher is already running or interval is 0. Safe to call on every Streamlit rerun.
+    """
+    global _watcher
+    with _engine_lock:
+        if _watcher is None and interval > 0:
+            _watcher = threading.Thread(target=_watch_kb, args=(interval,), name="kb-watcher", daemon=True)
+            _watcher.start()
+
+
+def _watch_kb(interval):
+    while True:
+        time.sleep(interval)
+        reload_engine()
+
+
+def reload_engine():
+    """
+    One check of the watcher: if the KB data file changed, builds the new index and its engine and
+    installs both together. Returns whether a new engine went live. Never raises: whatever a bad
+    edit breaks is logged, and the previous version keeps serving until the file is fixed.
+    """
+    global _engine
+    try:
+        built = build_changed_kb_index()
+        if built is None:
+            return False
+        kb_index, previous_index = built
+        # The engine is built before either is installed: embedding a changed KB in semantic mode
+        # takes a while, and until both go live together get_engine() keeps returning the current one.
+        retrieval_mode = _engine.retrieval_mode if _engine is not None else RETRIEVAL_MODE
+        engine = RetrievalEngine(kb_index, retrieval_mode=retrieval_mode)
+    except Exception as e:
+        log_event("kb_reload_failed", error=f"{type(e).__name__}: {e}")
+        return False
+    with _engine_lock:
+        if not install_kb_index(kb_index, previous_index):
+            return False
+        _engine = engine
+    log_event("kb_reloaded", keys=len(kb_index))
+    return True
+
+
+def get_top_k_from_kb(query, k=3):
+    """
+    Returns up to k (key, score, passage) tuples for the query from the shared engine.
+    """
+    return get_engine().top_k(query, k)
+
+
+def get_response_from_kb(query, similarity_threshold=None):
+    """
+    Returns the shared engine's answer text for the query, or None.
+    """
+    return get_engine().get_response(query, similarity_threshold)
@@ -0,0 +1,340 @@
+import functools
+import hashlib
+import threading
+
+import numpy as np
+
+from .artifact import TextTable, load_or_build_artifact, open_artifact, write_artifact
+from .config import KB_DATA_PATH, RANKER_NAME, kb_index_path
+from .kb_data import group_aliases, kb_file_signature, load_knowledge_base
+from .nlp import format_response_texts, preprocess_texts_for_matching
+from .passage_index import PassageIndex
+from .rankers import RANKERS, make_ranker
+
+# Bumped whenever the arrays written by KnowledgeBaseIndex.save change, so older artifacts are rebuilt.
+ARTIFACT_VERSION = 4
+
+
+class KnowledgeBaseIndex:
+    """
+    Everything derived from the knowledge base that matching needs: the keys in row order, the
+    fitted key ranker, the distinct answer bodies with the passage-level inverted index over
+    them, and every body and passage already formatted for display, so answering a query runs
+    no NLP over answer bodies.
+
+    Answer bodies are content-addressed (see kb_data.group_aliases): keys that share an answer
+    are aliases of one body, which is split, preprocessed, indexed and stored once.
+    key_bodies maps each key row to its body row, and body_keys maps each body to its first key.
+    lemma_table maps every word of the keys and passages to the lemma spaCy gave it there (see
+    nlp.record_lemma), so short queries can be lemmatized without the pipeline.
+
+    Build one from a {key: answer} dict, or load a compiled one with from_artifact(); a loaded
+    index reads its arrays and texts straight from the memory-mapped artifact. source_path is the
+    KB data file the index holds, as loaded (see load_or_compile_index), or None for an index of an
+    in-memory dict; artifacts derived from the index go next to it. An index is never
+    modified once built: updated() returns a new one, so a reader holding an index always sees
+    one consistent version of the knowledge base.
+    """
+    def __init__(self, knowledge_base, content_hash, ranker_name):
+        self.content_hash = content_hash
+        self.ranker_name = ranker_name
+        self.source_path = None
+        self.keys, key_bodies, self.bodies, self.body_hashes = group_aliases(knowledge_base)
+        self.key_bodies = np.asarray(key_bodies, dtype=np.int32)
+        self.body_keys = _first_keys(self.key_bodies, len(self.bodies))
+        self.lemma_table = {}
+        preprocess_many = functools.partial(preprocess_texts_for_matching, lemma_table=self.lemma_table)
+        self.key_ranker = make_ranker(ranker_name).fit(preprocess_many(self.keys))
+        self.passage_index = PassageIndex(
+            self.bodies, preprocess_many, make_ranker(ranker_name), format_response_texts
+        )
+        self.formatted_bodies = format_response_texts(self.bodies)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def items(self):
+        """
+        Returns the indexed knowledge base as a list of (key, answer) pairs, in row order.
+        Aliases share one answer string.
+        """
+        bodies = list(self.bodies)
+        return [(key, bodies[body]) for key, body in zip(self.keys, self.key_bodies)]
+
+    def updated(self, knowledge_base, content_hash=None):
+        """
+        Returns the index for an edited knowledge base without rebuilding it from scratch.
+        Keys and bodies already in this index keep their preprocessed and formatted rows (bodies
+        are matched by content hash, so renaming or aliasing an answer costs nothing); only new
+        keys and bodies go through spaCy. The rankers append their rows and recompute document
+        frequencies and weights from the stored term counts. The lemma table gains the words of the
+        added texts and keeps those of removed ones, whose lemmas are still what spaCy gives them.
+        """
+        content_hash = content_hash or kb_content_hash(knowledge_base)
+        if content_hash == self.content_hash:
+            return self
+        keys, key_bodies, bodies, body_hashes = group_aliases(knowledge_base)
+        # Rows among this index's keys (bodies) followed by the added ones, for Ranker.updated.
+        key_selection, added_keys = _reuse_rows(keys, list(self.keys))
+        body_selection, added_body_rows = _reuse_rows(body_hashes, list(self.body_hashes))
+        added_bodies = [bodies[row] for row in added_body_rows]
+
+        index = KnowledgeBaseIndex.__new__(KnowledgeBaseIndex)
+        index.content_hash = content_hash
+        index.ranker_name = self.ranker_name
+        index.source_path = None  # Its data file, if any, is for load_or_compile_index to say.
+        index.keys = keys
+        index.key_bodies = np.asarray(key_bodies, dtype=np.int32)
+        index.bodies = bodies
+        index.body_hashes = body_hashes
+        index.body_keys = _first_keys(index.key_bodies, len(bodies))
+        index.lemma_table = dict(self.lemma_table)
+        preprocess_many = functools.partial(preprocess_texts_for_matching, lemma_table=index.lemma_table)
+        index.key_ranker = self.key_ranker.updated(key_selection, preprocess_many([keys[row] for row in added_keys]))
+        index.passage_index = self.passage_index.updated(
+            body_selection, len(self.bodies), added_bodies, preprocess_many, format_response_texts
+        )
+        n_bodies = len(self.bodies)
+        added_formatted = format_response_texts(added_bodies)
+        index.formatted_bodies = [
+            self.formatted_bodies[row] if row < n_bodies else added_formatted[row - n_bodies] for row in body_selection
+        ]
+        return index
+
+    def save(self, path):
+        """
+        Compiles the index into a binary artifact at path (see retrieval/artifact.py).
+        """
+        arrays = {"key_bodies": self.key_bodies}
+        text_tables = (
+            ("keys", self.keys), ("bodies", self.bodies), ("hashes", self.body_hashes), ("formatted", self.formatted_bodies),
+            # Ambiguous forms are stored with an empty lemma.
+            ("lemma_forms", list(self.lemma_table)), ("lemmas", [lemma or "" for lemma in self.lemma_table.values()]),
+        )
+        for name, strings in text_tables:
+            table = TextTable.pack(strings)
+            arrays[f"{name}.blob"] = table.blob
+            arrays[f"{name}.offsets"] = table.offsets
+        arrays.update({f"key_ranker.{name}": array for name, array in self.key_ranker.to_arrays().items()})
+        arrays.update({f"passages.{name}": array for name, array in self.passage_index.to_arrays().items()})
+        metadata = {"version": ARTIFACT_VERSION, "content_hash": self.content_hash, "ranker_name": self.ranker_name}
+        write_artifact(path, arrays, metadata)
+
+    @classmethod
+    def from_artifact(cls, path):
+        """
+        Memory-maps a compiled index. Loading costs milliseconds and needs no spaCy; worker
+        processes mapping the same file share its pages.
+        """
+        metadata, arrays = open_artifact(path)
+        index = cls.__new__(cls)
+        index.content_hash = metadata["content_hash"]
+        index.ranker_name = metadata["ranker_name"]
+        index.source_path = None
+        index.keys = TextTable(arrays["keys.blob"], arrays["keys.offsets"])
+        index.key_bodies = arrays["key_bodies"]
+        index.bodies = TextTable(arrays["bodies.blob"], arrays["bodies.offsets"])
+        index.body_hashes = TextTable(arrays["hashes.blob"], arrays["hashes.offsets"])
+        index.body_keys = _first_keys(index.key_bodies, len(index.bodies))
+        index.formatted_bodies = TextTable(arrays["formatted.blob"], arrays["formatted.offsets"])
+        index.lemma_table = {
+            form: lemma or None for form, lemma in zip(
+                TextTable(arrays["lemma_forms.blob"], arrays["lemma_forms.offsets"]),
+                TextTable(arrays["lemmas.blob"], arrays["lemmas.offsets"]),
+            )
+        }
+        ranker_class = RANKERS[index.ranker_name]
+        index.key_ranker = ranker_class.from_arrays(_with_prefix(arrays, "key_ranker."))
+        index.passage_index = PassageIndex.from_arrays(_with_prefix(arrays, "passages."), ranker_class)
+        return index
+
+
+def _first_keys(key_bodies, n_bodies):
+    # np.unique returns the first occurrence of each body row.
+    body_keys = np.empty(n_bodies, dtype=np.int32)
+    rows, first = np.unique(key_bodies, return_index=True)
+    body_keys[rows] = first
+    return body_keys
+
+
+def _reuse_rows(names, old_names):
+    """
+    Returns (selection, added): for each of names, its row among old_names followed by the names
+    not found there, and the positions in names of those added ones.
+    """
+    old_rows = {name: row for row, name in enumerate(old_names)}
+    selection = np.empty(len(names), dtype=np.int64)
+    added = []
+    for position, name in enumerate(names):
+        row = old_rows.get(name)
+        if row is None:
+            row = len(old_names) + len(added)
+            added.append(position)
+        selection[position] = row
+    return selection, added
+
+
+def _with_prefix(arrays, prefix):
+    return {name[len(prefix):]: array for name, array in arrays.items() if name.startswith(prefix)}
+
+
+def kb_content_hash(knowledge_base):
+    """
+    Returns a stable hash of the knowledge base content, so the index is only rebuilt when an entry changes.
+    """
+    hasher = hashlib.sha256()
+    for key, answer in knowledge_base.items():
+        hasher.update(key.encode("utf-8"))
+        hasher.update(b"\0")
+        hasher.update(answer.encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def load_or_compile_index(kb_path=KB_DATA_PATH, ranker_name=RANKER_NAME, index_path=None, previous_index=None):
+    """
+    Returns the index for the KB data file at kb_path. The compiled artifact is memory-mapped
+    if it matches the file's content hash and the ranker; otherwise the index is built (or, given
+    the previous_index of an earlier version of the file, updated from it) and the artifact
+    rewritten, so the next process to start can map it.
+    """
+    knowledge_base = load_knowledge_base(kb_path)
+    content_hash = kb_content_hash(knowledge_base)
+
+    def is_current(metadata):
+        return (metadata.get("version") == ARTIFACT_VERSION and metadata["content_hash"] == content_hash
+                and metadata["ranker_name"] == ranker_name)
+
+    def build():
+        if previous_index is not None and previous_index.ranker_name == ranker_name:
+            return previous_index.updated(knowledge_base, content_hash)
+        return KnowledgeBaseIndex(knowledge_base, content_hash, ranker_name)
+
+    index = load_or_build_artifact(
+        index_path or kb_index_path(kb_path, ranker_name), is_current, KnowledgeBaseIndex.from_artifact, build
+    )
+    index.source_path = kb_path
+    return index
+
+
+# The index is built once per process and shared by every session and thread.
+_index = None
+_index_source = None
+_index_lock = threading.Lock()
+# The (mtime, size) of the data file version last loaded or attempted, and the lock that keeps
+# reloads from overlapping; reloads build outside _index_lock, so requests never wait on them.
+_checked_signature = None
+_reload_lock = threading.Lock()
+
+
+def get_kb_index(knowledge_base=None, ranker_name=RANKER_NAME):
+    """
+    Returns the shared KnowledgeBaseIndex, loading or building it on first use.
+    By default it comes from the KB data file (see load_or_compile_index); later edits to the
+    file are picked up by reload_kb_index(), which the engine's watcher thread calls. Pass
+    knowledge_base to index a specific dict instead; it is rebuilt only when its content hash or
+    the ranker changes. The dict is treated as read-only: the same object is assumed unchanged
+    without rehashing it.
+    A changed KB is applied to the current index incrementally (see KnowledgeBaseIndex.updated)
+    and swapped in once complete; callers still holding the old index are unaffected.
+    """
+    global _index, _index_source, _checked_signature
+    source = KB_DATA_PATH if knowledge_base is None else knowledge_base
+    index = _index
+    if index is not None and index.ranker_name == ranker_name and _same_source(source, _index_source):
+        return index
+
+    with _index_lock:
+        if _index is not None and _index.ranker_name == ranker_name and _same_source(source, _index_source):
+            return _index
+        if knowledge_base is None:
+            # Taken before reading, so an edit made during the load is still seen as a change.
+            _checked_signature = kb_file_signature(KB_DATA_PATH)
+            _index = load_or_compile_index(KB_DATA_PATH, ranker_name, previous_index=_index)
+        else:
+            content_hash = kb_content_hash(knowledge_base)
+            if _index is not None and _index.ranker_name == ranker_name:
+                if _index.content_hash != content_hash:
+                    _index = _index.updated(knowledge_base, content_hash)
+            else:
+                _index = KnowledgeBaseIndex(knowledge_base, content_hash, ranker_name)
+        _index_source = source
+        return _index
+
+
+def reload_kb_index():
+    """
+    Reloads the shared index if the KB data file changed since it was last loaded. The new index
+    is built without holding the index lock, so queries keep being answered from the current one
+    until it is swapped in. Returns the new index, or None if there was nothing to reload (the
+    file is unchanged, or the shared index was not built from it).
+    A file that fails to load (say, saved halfway) raises OSError or ValueError and is not retried
+    until it changes again; the current index stays in place.
+    """
+    built = build_changed_kb_index()
+    if built is None or not install_kb_index(*built):
+        return None
+    return built[0]
+
+
+def build_changed_kb_index():
+    """
+    The first half of reload_kb_index: builds the index for the changed KB data file without
+    installing it. Returns (new index, the shared index it replaces), or None, as reload_kb_index.
+    Pass both to install_kb_index, once whatever must go live with the new index is ready.
+    """
+    global _checked_signature
+    with _reload_lock:
+        previous_index = _index
+        if previous_index is None or _index_source != KB_DATA_PATH:
+            return None
+        signature = kb_file_signature(KB_DATA_PATH)
+        if signature == _checked_signature:
+            return None
+        _checked_signature = signature
+        index = load_or_compile_index(KB_DATA_PATH, previous_index.ranker_name, previous_index=previous_index)
+        return index, previous_index
+
+
+def install_kb_index(index, previous_index):
+    """
+    Makes index the shared index, unless the shared index is no longer previous_index. Returns
+    whether it was installed.
+    """
+    global _index, _checked_signature
+    with _index_lock:
+        if _index is not previous_index:
+            # Replaced meanwhile (another ranker or KB was requested): check the file again next time.
+            _checked_signature = None
+            return False
+        _index = index
+        return True
+
+
+def update_kb_index(upserts=None, deletions=()):
+    """
+    Adds or replaces the entries in upserts ({key: answer}) and removes the keys in deletions,
+    on the live shared index. New keys are appended; replaced ones keep their position. The
+    whole edit becomes visible at once, and only the edited entries are reprocessed.
+    Raises KeyError, without changing anything, if a key to delete is not in the KB.
+    The data file is not modified: edit it as well for the change to survive a restart.
+    Returns the new index.
+    """
+    global _index
+    if _index is None:
+        get_kb_index()
+    with _index_lock:
+        knowledge_base = dict(_index.items())
+        for key in deletions:
+            if key not in knowledge_base:
+                raise KeyError(f"'{key}' is not in the knowledge base")
+            del knowledge_base[key]
+        knowledge_base.update(upserts or {})
+        _index = _index.updated(knowledge_base)
+        return _index
+
+
+def _same_source(source, other):
+    if isinstance(source, str):
+        return source == other
+    return source is other
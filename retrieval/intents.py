@@ -0,0 +1,75 @@
+"""
+Small-talk pre-routing: greetings, thanks, goodbyes and requests for help are recognised by a
+single precompiled regular expression and answered with a canned reply, without touching the KB.
+
+A greeting only has to open the message ("hi, who is the president?" is answered as a greeting,
+as it always was); the other intents must be the whole message, so "help with passport renewal"
+still goes to the KB.
+"""
+import random
+import re
+
+INTENT_PHRASES = {
+    "greeting": ["hi", "hello", "hey", "good morning", "good afternoon", "good evening"],
+    "thanks": ["thanks", "thank you", "thanks a lot", "thank you so much", "thank you very much", "thx", "cheers"],
+    "goodbye": ["bye", "goodbye", "bye bye", "see you", "see you later", "good night", "take care"],
+    "help": ["help", "help me", "what can you do", "what can i ask", "what do you know", "how does this work"],
+}
+# Intents answered whenever the message starts with one of their phrases; the rest must match it all.
+PREFIX_INTENTS = ("greeting",)
+
+INTENT_RESPONSES = {
+    "greeting": [
+        "Hello! How can I help you with information about the Nigerian government?",
+        "Hi there! What can I tell you about the Nigerian government today?",
+        "Hey! Ask away about the Nigerian government.",
+        "Greetings! What's your question regarding the Nigerian government?",
+    ],
+    "thanks": [
+        "You're welcome! Is there anything else you'd like to know about the Nigerian government?",
+        "Glad I could help. Ask me anything else about the Nigerian government.",
+    ],
+    "goodbye": [
+        "Goodbye! Come back any time you have a question about the Nigerian government.",
+        "Take care! I'm here whenever you need information about the Nigerian government.",
+    ],
+    "help": [
+        "I answer questions about the Nigerian government: its leaders, ministries and agencies, policies, "
+        "history and public services. Try asking \"Who is the president of Nigeria?\" or "
+        "\"How do I apply for a passport?\"",
+    ],
+}
+
+
+def _phrase_pattern(phrase):
+    # Words may be separated by any run of whitespace.
+    return r"\s+".join(re.escape(word) for word in phrase.split())
+
+
+def _intent_pattern(intent):
+    # Longest phrases first, so "thank you so much" is not cut short at "thank you".
+    phrases = "|".join(_phrase_pattern(phrase) for phrase in sorted(INTENT_PHRASES[intent], key=len, reverse=True))
+    if intent in PREFIX_INTENTS:
+        # The phrase must end at a word boundary: "hi" opens "hi, there" and "hi!" but not "history".
+        return rf"(?P<{intent}>(?:{phrases})(?=[\s,.!?]|$))"
+    return rf"(?P<{intent}>(?:{phrases})[\s,.!?]*$)"
+
+
+_INTENT_RE = re.compile(r"\s*(?:" + "|".join(_intent_pattern(intent) for intent in INTENT_PHRASES) + ")", re.I)
+
+
+def match_intent(query):
+    """
+    Returns the small-talk intent of query ("greeting", "thanks", "goodbye" or "help"), or None
+    if it should go to the knowledge base.
+    """
+    match = _INTENT_RE.match(query)
+    return match.lastgroup if match else None
+
+
+def small_talk_response(query):
+    """
+    Returns a canned reply if query is small talk (see match_intent), otherwise None.
+    """
+    intent = match_intent(query)
+    return random.choice(INTENT_RESPONSES[intent]) if intent else None
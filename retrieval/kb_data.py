@@ -0,0 +1,95 @@
+import hashlib
+import json
+import os
+import textwrap
+
+
+def load_knowledge_base(path):
+    """
+    Reads a knowledge base data file into an ordered {key: answer} dict.
+    JSON Lines files hold one object per line: {"key": ..., "answer": ...}, or
+    {"key": ..., "alias_of": ...} for another name of an entry defined elsewhere in the file.
+    Parquet files (read with pyarrow) need "key" and "answer" string columns and may add an
+    "alias_of" column, null except on alias rows. Later duplicates of a key win, as they would
+    in a dict literal. Aliases share their target's answer string rather than a copy of it.
+    Raises ValueError, naming the line or row, if a record is malformed: every key, answer and
+    alias_of must be a non-empty string.
+    """
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq  # Deferred: only needed for Parquet sources.
+
+        table = pq.read_table(path)
+        missing = [name for name in ("key", "answer") if name not in table.column_names]
+        if missing:
+            raise ValueError(f"{path}: missing column(s) {', '.join(missing)}")
+        records = [
+            (row_number, key, answer, alias_of)
+            for row_number, (key, answer, alias_of) in enumerate(zip(
+                table.column("key").to_pylist(),
+                table.column("answer").to_pylist(),
+                table.column("alias_of").to_pylist() if "alias_of" in table.column_names else [None] * table.num_rows,
+            ), start=1)
+        ]
+    else:
+        records = []
+        with open(path, encoding="utf-8") as kb_file:
+            for line_number, line in enumerate(kb_file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    records.append((line_number, record["key"], record.get("answer"), record.get("alias_of")))
+                except (ValueError, KeyError, AttributeError) as e:
+                    raise ValueError(f"{path}:{line_number}: expected a JSON object with a 'key' ({e})") from None
+
+    for line_number, key, answer, alias_of in records:
+        for name, value in (("key", key), ("answer", answer), ("alias_of", alias_of)):
+            if (value is not None or name == "key") and not (isinstance(value, str) and value.strip()):
+                raise ValueError(f"{path}:{line_number}: '{name}' must be a non-empty string, not {value!r}")
+    answers = {key: answer for _, key, answer, alias_of in records if alias_of is None}
+    knowledge_base = {}
+    for line_number, key, answer, alias_of in records:
+        if alias_of is not None:
+            answer = answers.get(alias_of)
+            if answer is None:
+                raise ValueError(f"{path}:{line_number}: '{key}' is an alias of '{alias_of}', which has no answer")
+        elif answer is None:
+            raise ValueError(f"{path}:{line_number}: '{key}' needs an 'answer' or an 'alias_of'")
+        knowledge_base[key] = answer
+    return knowledge_base
+
+
+def body_hash(answer):
+    """
+    Returns the content address of an answer body: the SHA-256 of its text, ignoring
+    indentation and surrounding blank lines, so copies of one answer share an address.
+    """
+    return hashlib.sha256(textwrap.dedent(answer).strip().encode("utf-8")).hexdigest()
+
+
+def group_aliases(knowledge_base):
+    """
+    Stores each distinct answer body of a {key: answer} dict once, keyed by its content hash.
+    Returns (keys, key_bodies, bodies, body_hashes): every key, the row of its body in bodies,
+    and the distinct bodies with their hashes, in order of first appearance.
+    """
+    body_rows = {}
+    keys, key_bodies, bodies, body_hashes = [], [], [], []
+    for key, answer in knowledge_base.items():
+        address = body_hash(answer)
+        row = body_rows.get(address)
+        if row is None:
+            row = body_rows[address] = len(bodies)
+            bodies.append(answer)
+            body_hashes.append(address)
+        keys.append(key)
+        key_bodies.append(row)
+    return keys, key_bodies, bodies, body_hashes
+
+
+def kb_file_signature(path):
+    """
+    Returns (mtime_ns, size) for a data file: a cheap way to notice it changed without reading it.
+    """
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
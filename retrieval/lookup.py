@@ -0,0 +1,146 @@
+"""
+Fast path for queries that are (nearly) a KB key, such as "capital of nigeria" or "Currency of Nigeria?".
+They are looked up in hash tables before any NLP runs, in microseconds.
+
+Three lookups, in order:
+    exact       the query, lowercased and stripped, is a key
+    normalised  the same after dropping punctuation and filler words ("What is the capital of Nigeria?")
+    fuzzy       a normalised key with the same words as the normalised query, except that each
+                query word the keys never use is within a few character edits of the key's word in
+                its place (typos)
+
+Words the keys already use are never corrected, so "capital of niger" is not read as "capital of
+nigeria". Anything else, and any fuzzy match that is ambiguous between two answers, goes to the
+full search.
+"""
+import re
+
+from .config import KEY_LOOKUP_MAX_EDITS
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+# Question words and function words that do not change which key a query names.
+FILLER_WORDS = frozenset(
+    "a an the of in on for to is are was were who whom what which where when how do does did "
+    "please tell me about can you i".split()
+)
+
+
+def normalise_key(text):
+    """
+    Lowercases text and reduces it to its non-filler words, separated by single spaces.
+    """
+    return " ".join(word for word in _WORD_RE.findall(text.lower()) if word not in FILLER_WORDS)
+
+
+def max_edits(text, limit=KEY_LOOKUP_MAX_EDITS):
+    """
+    How many character edits correcting the word text tolerates: none for short words, where one
+    edit already changes the meaning, then one, then two from 12 characters, capped at limit.
+    """
+    if len(text) < 5:
+        return 0
+    return min(limit, 1 if len(text) < 12 else 2)
+
+
+def edit_distance(a, b, limit):
+    """
+    Edits (insertions, deletions, substitutions and swaps of two adjacent characters, the commonest
+    typo) between a and b, or limit + 1 as soon as there must be more than limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before_previous, previous_row = None, list(range(len(b) + 1))
+    for i, char in enumerate(a, start=1):
+        row = [i]
+        smallest = i
+        for j, other in enumerate(b, start=1):
+            # Plain comparisons rather than min(): this loop is where fuzzy lookups spend their time.
+            value = previous_row[j - 1] + (char != other)
+            if row[j - 1] < value:
+                value = row[j - 1] + 1
+            if previous_row[j] < value:
+                value = previous_row[j] + 1
+            if i > 1 and j > 1 and char == b[j - 2] and a[i - 2] == other and before_previous[j - 2] + 1 < value:
+                value = before_previous[j - 2] + 1
+            row.append(value)
+            if value < smallest:
+                smallest = value
+        if smallest > limit:
+            return limit + 1
+        before_previous, previous_row = previous_row, row
+    return previous_row[-1]
+
+
+class KeyLookup:
+    """
+    The exact, normalised and fuzzy key tables for one KnowledgeBaseIndex. find() returns
+    (key_row, score) or None; the score is 1.0 for exact and normalised hits and
+    1 - edits / length for fuzzy ones.
+    """
+    def __init__(self, keys, key_bodies, max_edit_distance=KEY_LOOKUP_MAX_EDITS):
+        self.key_bodies = key_bodies
+        self.max_edit_distance = max_edit_distance
+        self.exact = {}
+        self.normalised = {}
+        self.vocabulary = set()
+        # The normalised keys as (words, row), by word count and by (word count, position, word), so a
+        # fuzzy lookup only compares keys that have the query's correctly spelt words in the same places.
+        self.by_length = {}
+        self.by_word = {}
+        for row, key in enumerate(keys):
+            self.exact.setdefault(key.lower().strip(), row)
+            normalised = normalise_key(key)
+            if not normalised or normalised in self.normalised:
+                continue
+            self.normalised[normalised] = row
+            words = tuple(normalised.split())
+            self.vocabulary.update(words)
+            self.by_length.setdefault(len(words), []).append((words, row))
+            for position, word in enumerate(words):
+                self.by_word.setdefault((len(words), position, word), []).append((words, row))
+
+    def find(self, query):
+        row = self.exact.get(query.lower().strip())
+        if row is not None:
+            return row, 1.0
+        normalised = normalise_key(query)
+        row = self.normalised.get(normalised)
+        if row is not None:
+            return row, 1.0
+        if not self.max_edit_distance:
+            return None
+        return self._fuzzy(normalised)
+
+    def _fuzzy(self, normalised):
+        # Only words the keys never use are taken for typos; the rest must match exactly, so a query
+        # naming "niger" is never read as one about "nigeria".
+        words = normalised.split()
+        misspelt = [position for position, word in enumerate(words) if word not in self.vocabulary]
+        if not misspelt:
+            return None  # Every word is spelt as in the keys; the search will weigh them.
+        limits = [max_edits(words[position], self.max_edit_distance) for position in misspelt]
+        if not all(limits):
+            return None  # A misspelt word too short to correct safely.
+        known = [position for position in range(len(words)) if position not in misspelt]
+        candidates = min(
+            (self.by_word.get((len(words), position, words[position]), []) for position in known),
+            key=len, default=self.by_length.get(len(words), []),
+        )
+        best, rows = None, []
+        for key_words, row in candidates:
+            if any(key_words[position] != words[position] for position in known):
+                continue
+            edits = 0
+            for position, limit in zip(misspelt, limits):
+                distance = edit_distance(words[position], key_words[position], limit)
+                if distance > limit:
+                    break
+                edits += distance
+            else:
+                if best is None or edits < best:
+                    best, rows = edits, [row]
+                elif edits == best:
+                    rows.append(row)
+        if not rows or len({int(self.key_bodies[row]) for row in rows}) != 1:
+            return None  # No key within reach, or equally close keys with different answers.
+        return min(rows), 1.0 - best / len(normalised)
@@ -0,0 +1,231 @@
+"""
+Prometheus metrics for the chatbot, served as text on a local port (METRICS_PORT) by a daemon thread.
+
+Exported, from the telemetry histograms (see retrieval/telemetry.py) and the current engine:
+    govfocus_query_latency_seconds          histogram of KB retrieval latency (get_response_from_kb: key lookup
+                                            or search, no small talk or cache hits), plus estimated p50/p95/p99
+    govfocus_message_latency_seconds        histogram of whole-message latency, every path included
+    govfocus_stage_latency_seconds{stage}   histogram per pipeline stage
+    govfocus_queries_total{path}            queries by how they were answered; fallbacks and their ratio
+    govfocus_match_score                    histogram of top match scores, next to govfocus_similarity_threshold
+    govfocus_kb_*, govfocus_index_*         KB and index sizes
+    govfocus_answer_cache_*                 answer cache hits, misses and size
+    govfocus_process_*_memory_bytes         resident and peak memory
+    govfocus_active_sessions                chat sessions seen within ACTIVE_SESSION_WINDOW
+
+Point a Prometheus scrape job at http://127.0.0.1:<METRICS_PORT>/metrics.
+"""
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .config import ACTIVE_SESSION_WINDOW, METRICS_HOST, METRICS_PORT, kb_index_path
+from .telemetry import TELEMETRY
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Last time each chat session was seen, for the active session count.
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def record_session(session_id):
+    """
+    Marks a chat session as active now. Call it on every message or rerun of the session.
+    """
+    now = time.monotonic()
+    with _sessions_lock:
+        _sessions[session_id] = now
+        if len(_sessions) > 1000:
+            # Forget long-idle sessions so the table stays bounded.
+            for stale in [sid for sid, seen in _sessions.items() if now - seen > ACTIVE_SESSION_WINDOW]:
+                del _sessions[stale]
+
+
+def active_session_count(window=ACTIVE_SESSION_WINDOW):
+    """
+    Returns how many sessions were seen within the last window seconds.
+    """
+    now = time.monotonic()
+    with _sessions_lock:
+        return sum(1 for seen in _sessions.values() if now - seen <= window)
+
+
+def _memory_bytes():
+    # (resident, peak resident) from /proc on Linux; elsewhere only the peak, from getrusage.
+    try:
+        with open("/proc/self/status") as status:
+            fields = dict(line.split(":", 1) for line in status if ":" in line)
+        return int(fields["VmRSS"].split()[0]) * 1024, int(fields["VmHWM"].split()[0]) * 1024
+    except (OSError, KeyError, ValueError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        return None, peak
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in labels.items()) + "}"
+
+
+class _Exposition:
+    """
+    Accumulates metric families in the Prometheus text format.
+    """
+    def __init__(self):
+        self.lines = []
+        self.described = set()
+
+    def describe(self, name, metric_type, help_text):
+        if name not in self.described:
+            self.described.add(name)
+            self.lines.append(f"# HELP {name} {help_text}")
+            self.lines.append(f"# TYPE {name} {metric_type}")
+
+    def sample(self, name, value, labels=None):
+        if value is not None:
+            self.lines.append(f"{name}{_labels(labels)} {float(value):.10g}")
+
+    def histogram(self, name, snapshot, help_text, labels=None):
+        self.describe(name, "histogram", help_text)
+        labels = labels or {}
+        cumulative = 0
+        for bound, count in zip(snapshot["bounds"], snapshot["counts"]):
+            cumulative += count
+            self.sample(f"{name}_bucket", cumulative, dict(labels, le=f"{bound:g}"))
+        self.sample(f"{name}_bucket", snapshot["count"], dict(labels, le="+Inf"))
+        self.sample(f"{name}_sum", snapshot["sum"], labels)
+        self.sample(f"{name}_count", snapshot["count"], labels)
+
+    def text(self):
+        return "\n".join(self.lines) + "\n"
+
+
+def render_metrics(engine=None):
+    """
+    Returns the current metrics in the Prometheus text exposition format. engine defaults to the
+    process-wide one, if it has been built.
+    """
+    if engine is None:
+        from .engine import current_engine  # Deferred: the exporter starts before the engine exists.
+
+        engine = current_engine()
+    snapshot = TELEMETRY.snapshot()
+    histograms, counters = snapshot["histograms"], snapshot["counters"]
+    out = _Exposition()
+
+    query = histograms.get("kb_query")
+    if query is not None:
+        out.histogram("govfocus_query_latency_seconds", query,
+                      "Latency of answering one message from the KB, by key lookup or search.")
+        out.describe("govfocus_query_latency_quantile_seconds", "gauge",
+                     "Estimated KB query latency quantiles since start.")
+        for q in QUANTILES:
+            out.sample("govfocus_query_latency_quantile_seconds", TELEMETRY.histograms["kb_query"].quantile(q),
+                       {"quantile": f"{q:g}"})
+    message = histograms.get("message")
+    if message is not None:
+        out.histogram("govfocus_message_latency_seconds", message,
+                      "Latency of answering one chat message, small talk and cached answers included.")
+    for name, histogram in sorted(histograms.items()):
+        if name.startswith("stage."):
+            out.histogram("govfocus_stage_latency_seconds", histogram, "Latency of one pipeline stage.",
+                          {"stage": name[len("stage."):]})
+
+    out.describe("govfocus_queries_total", "counter", "Chat messages by how they were answered.")
+    for name, value in sorted(counters.items()):
+        if name.startswith("path."):
+            out.sample("govfocus_queries_total", value, {"path": name[len("path."):]})
+    out.describe("govfocus_fallbacks_total", "counter", "Messages answered with the fallback response.")
+    out.sample("govfocus_fallbacks_total", counters.get("fallbacks", 0))
+    out.describe("govfocus_fallback_ratio", "gauge", "Share of messages answered with the fallback response.")
+    out.sample("govfocus_fallback_ratio", counters.get("fallbacks", 0) / counters["queries"] if counters.get("queries") else 0)
+
+    score = histograms.get("score")
+    if score is not None:
+        out.histogram("govfocus_match_score", score, "Score of the best KB match per message.")
+    if engine is not None:
+        out.describe("govfocus_similarity_threshold", "gauge", "Score a match needs to be answered.")
+        out.sample("govfocus_similarity_threshold", engine.similarity_threshold, {"mode": engine.retrieval_mode})
+        _engine_metrics(out, engine)
+
+    resident, peak = _memory_bytes()
+    out.describe("govfocus_process_resident_memory_bytes", "gauge", "Resident memory of the process.")
+    out.sample("govfocus_process_resident_memory_bytes", resident)
+    out.describe("govfocus_process_peak_memory_bytes", "gauge", "Peak resident memory of the process.")
+    out.sample("govfocus_process_peak_memory_bytes", peak)
+    out.describe("govfocus_active_sessions", "gauge", "Chat sessions active within the session window.")
+    out.sample("govfocus_active_sessions", active_session_count())
+    return out.text()
+
+
+def _engine_metrics(out, engine):
+    kb_index = engine.kb_index
+    sizes = (
+        ("govfocus_kb_keys", len(kb_index), "KB keys, aliases included."),
+        ("govfocus_kb_answers", len(kb_index.bodies), "Distinct KB answers."),
+        ("govfocus_kb_passages", len(kb_index.passage_index.passages), "Indexed answer passages."),
+        ("govfocus_kb_terms", len(kb_index.passage_index.ranker.vocabulary), "Distinct lemmas in the passage index."),
+    )
+    for name, value, help_text in sizes:
+        out.describe(name, "gauge", help_text)
+        out.sample(name, value)
+    out.describe("govfocus_index_artifact_bytes", "gauge", "Size of the compiled index artifacts on disk.")
+    artifacts = (kb_index.ranker_name, "semantic") if engine.semantic_index is not None else (kb_index.ranker_name,)
+    for artifact in artifacts if kb_index.source_path else ():
+        path = kb_index_path(kb_index.source_path, artifact)
+        if os.path.exists(path):
+            out.sample("govfocus_index_artifact_bytes", os.path.getsize(path), {"artifact": artifact})
+
+    cache = engine.answer_cache.stats()
+    for name in ("hits", "misses"):
+        out.describe(f"govfocus_answer_cache_{name}_total", "counter", f"Answer cache {name}.")
+        out.sample(f"govfocus_answer_cache_{name}_total", cache[name])
+    out.describe("govfocus_answer_cache_entries", "gauge", "Answers held in the cache.")
+    out.sample("govfocus_answer_cache_entries", cache["size"])
+    out.describe("govfocus_semantic_timeouts_total", "counter", "Hybrid queries answered without the semantic side.")
+    out.sample("govfocus_semantic_timeouts_total", engine.semantic_timeouts)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = render_metrics().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes every few seconds would flood the app's log.
+
+
+# The exporter, started at most once per process.
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port=METRICS_PORT, host=METRICS_HOST):
+    """
+    Serves render_metrics() at http://host:port/metrics from a daemon thread. Does nothing if the
+    server is already running or port is 0. Safe to call on every Streamlit rerun; if the port is
+    taken (say, by another app process), the error is printed once and metrics stay off.
+    """
+    global _server
+    with _server_lock:
+        if _server is not None or not port:
+            return
+        try:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        except OSError as e:
+            print(f"Metrics exporter not started on {host}:{port}: {e}")
+            _server = False
+            return
+        _server.daemon_threads = True
+        threading.Thread(target=_server.serve_forever, name="metrics-exporter", daemon=True).start()
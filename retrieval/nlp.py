@@ -0,0 +1,182 @@
+import threading
+
+import numpy as np
+
+from .config import EMBEDDING_MODEL, LEMMA_LOOKUP_MAX_TOKENS, NLP_BATCH_SIZE
+
+# The pipeline used for matching and formatting.
+SPACY_MODEL = "en_core_web_sm"
+
+_nlp = None
+_embedding_nlp = None
+_nlp_lock = threading.Lock()
+
+
+def load_nlp_pipeline():
+    """
+    Loads the SpaCy English model once per process and shares it across sessions and threads.
+    Matching only needs the tokenizer, stop-word flags and the lemmatizer (plus the tagger and
+    attribute_ruler it reads POS tags from), so NER and the dependency parser are never loaded.
+    The rule-based sentencizer replaces the parser for the sentence splits in format_response_text.
+    Raises OSError if en_core_web_sm is not installed.
+    """
+    global _nlp
+    if _nlp is None:
+        with _nlp_lock:
+            if _nlp is None:
+                import spacy  # Deferred: importing spaCy alone takes about a second.
+
+                pipeline = spacy.load(SPACY_MODEL, exclude=["ner", "parser"])
+                pipeline.add_pipe("sentencizer")
+                _nlp = pipeline
+    return _nlp
+
+
+def _processed_tokens(doc, lemma_table=None):
+    words = [token for token in doc if token.is_alpha and not token.is_stop]
+    if lemma_table is not None:
+        for token in words:
+            record_lemma(lemma_table, token.text, token.lemma_)
+    return " ".join(token.lemma_ for token in words)
+
+
+def record_lemma(lemma_table, form, lemma):
+    """
+    Records in lemma_table that the spaCy pipeline lemmatized form (a lowercase word) as lemma.
+    A form seen with two different lemmas (the tagger read "leaves" as a verb in one sentence and
+    a noun in another) is marked None: its lemma depends on context, so it cannot be looked up.
+    """
+    previous = lemma_table.get(form, lemma)
+    lemma_table[form] = lemma if previous == lemma else None
+
+
+def _lookup_processed_tokens(text, lemma_table):
+    # Tokenizer plus table lookups; None if a content word is missing or ambiguous in the table,
+    # or the text is too long for its words to be trusted out of context.
+    doc = load_nlp_pipeline().tokenizer(text)
+    if len(doc) > LEMMA_LOOKUP_MAX_TOKENS:
+        return None
+    lemmas = []
+    for token in doc:
+        if token.is_alpha and not token.is_stop:
+            lemma = lemma_table.get(token.text)
+            if lemma is None:
+                return None
+            lemmas.append(lemma)
+    return " ".join(lemmas)
+
+
+def preprocess_text_for_matching(text, lemma_table=None):
+    """
+    Tokenizes, converts to lowercase, removes stopwords, and lemmatizes the text using SpaCy.
+    Returns a space-separated string of processed words.
+    Given a lemma_table (see record_lemma), a short text whose content words are all in it is only
+    run through the tokenizer and lemmatized from the table, for the same result at a fraction of
+    the cost; anything else goes through the full pipeline.
+    """
+    text = text.lower()
+    if lemma_table is not None:
+        processed = _lookup_processed_tokens(text, lemma_table)
+        if processed is not None:
+            return processed
+    return _processed_tokens(load_nlp_pipeline()(text))
+
+
+def preprocess_texts_for_matching(texts, batch_size=NLP_BATCH_SIZE, lemma_table=None):
+    """
+    Batch version of preprocess_text_for_matching, streaming the texts through nlp.pipe.
+    Given a lemma_table, the lemma of every content word is recorded in it (see record_lemma).
+    """
+    nlp = load_nlp_pipeline()
+    docs = nlp.pipe((text.lower() for text in texts), batch_size=batch_size)
+    return [_processed_tokens(doc, lemma_table) for doc in docs]
+
+
+def _is_preformatted(text):
+    # If the text explicitly contains Markdown list syntax or multiple newlines,
+    # assume it's pre-formatted and return it as is.
+    return "\n*" in text or "\n\n" in text
+
+
+def format_response_text(text):
+    if _is_preformatted(text):
+        return text
+    else:
+        # Otherwise, apply sentence tokenization for better readability
+        doc = load_nlp_pipeline()(text)
+        sentences = [sent.text.strip() for sent in doc.sents]
+        return "\n\n".join(sentences)
+
+
+def format_response_texts(texts, batch_size=NLP_BATCH_SIZE):
+    """
+    Batch version of format_response_text, used to format every answer once at index build time.
+    Only the texts that need sentence splitting go through nlp.pipe, and only its sentencizer runs.
+    """
+    nlp = load_nlp_pipeline()
+    formatted = list(texts)
+    to_split = [i for i, text in enumerate(formatted) if not _is_preformatted(text)]
+    only_sentencizer = [name for name in nlp.pipe_names if name != "sentencizer"]
+    docs = nlp.pipe((formatted[i] for i in to_split), batch_size=batch_size, disable=only_sentencizer)
+    for i, doc in zip(to_split, docs):
+        formatted[i] = "\n\n".join(sent.text.strip() for sent in doc.sents)
+    return formatted
+
+
+def load_embedding_pipeline():
+    """
+    Returns the spaCy pipeline whose vectors semantic search uses: EMBEDDING_MODEL (an installed
+    package name or a local model directory) if set, otherwise the matching pipeline. Either way
+    the model is read from disk, so semantic search runs offline on CPU.
+    """
+    global _embedding_nlp
+    if not EMBEDDING_MODEL:
+        return load_nlp_pipeline()
+    if _embedding_nlp is None:
+        with _nlp_lock:
+            if _embedding_nlp is None:
+                import spacy  # Deferred: importing spaCy alone takes about a second.
+
+                _embedding_nlp = spacy.load(EMBEDDING_MODEL, exclude=["ner", "parser", "lemmatizer"])
+    return _embedding_nlp
+
+
+def _text_vector(doc):
+    # Content words carry the meaning; stop words would pull every text towards the same average.
+    tokens = [token for token in doc if token.is_alpha and not token.is_stop] or list(doc)
+    if not tokens:
+        return None
+    vector = np.mean([token.vector for token in tokens], axis=0).astype(np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+def embed_texts(texts, batch_size=NLP_BATCH_SIZE):
+    """
+    Returns a len(texts) x width float32 matrix of L2-normalised embeddings for a list of texts:
+    the mean vector of each text's content words. Tokens take their static word vectors if the
+    pipeline has them and their tok2vec context vectors otherwise; nothing else in the pipeline
+    runs. Empty texts get a zero vector. Raises ValueError if the pipeline has neither.
+    """
+    nlp = load_embedding_pipeline()
+    if nlp.vocab.vectors.shape[0]:
+        disabled = nlp.pipe_names
+    elif "tok2vec" in nlp.pipe_names:
+        disabled = [name for name in nlp.pipe_names if name != "tok2vec"]
+    else:
+        raise ValueError(f"The spaCy pipeline '{nlp.meta.get('name')}' has no word vectors or tok2vec to embed texts with")
+    docs = nlp.pipe((text.lower() for text in texts), batch_size=batch_size, disable=disabled)
+    vectors = [_text_vector(doc) for doc in docs]
+    width = next((len(vector) for vector in vectors if vector is not None), 0)
+    matrix = np.zeros((len(vectors), width), dtype=np.float32)
+    for row, vector in enumerate(vectors):
+        if vector is not None:
+            matrix[row] = vector
+    return matrix
+
+
+def embed_text(text):
+    """
+    Single-text version of embed_texts; returns one normalised vector.
+    """
+    return embed_texts([text])[0]
@@ -0,0 +1,150 @@
+import re
+import textwrap
+
+import numpy as np
+
+from .artifact import TextTable
+
+# A list item at the start of a line: "* ...", "- ...", "• ..." or "1. ..."
+BULLET_PATTERN = re.compile(r"^(?:[*\-•]|\d+\.)\s+")
+# Citation lines are kept with the passage they back up instead of becoming passages of their own
+SOURCE_PATTERN = re.compile(r"^\[?\s*Sources?\s*:", re.IGNORECASE)
+# A short line ending in a colon ("Early Life and Education:", "**Second Republic (1979–1983):**")
+HEADING_PATTERN = re.compile(r"^[^.!?]{1,80}:(?:\*\*)?$")
+
+
+def split_passages(text):
+    """
+    Splits a knowledge base answer into passages: one per paragraph and one per top-level bullet.
+    Nested bullets and continuation lines stay with their parent bullet, a heading line is prefixed
+    to the passage that follows it, and source lines are attached to the passage before them.
+    """
+    passages = []
+    pending_heading = None
+    for block in re.split(r"\n\s*\n", textwrap.dedent(text).strip()):
+        lines = [line.rstrip() for line in block.splitlines() if line.strip()]
+        if not lines:
+            continue
+        base_indent = min(len(line) - len(line.lstrip()) for line in lines)
+
+        groups = []
+        for line in lines:
+            is_top_level_bullet = (
+                len(line) - len(line.lstrip()) == base_indent and BULLET_PATTERN.match(line.lstrip())
+            )
+            if is_top_level_bullet or not groups:
+                groups.append([line])
+            else:
+                groups[-1].append(line)
+
+        for group in groups:
+            passage = textwrap.dedent("\n".join(group)).strip()
+            if SOURCE_PATTERN.match(passage) and passages:
+                passages[-1] = passages[-1] + "\n" + passage
+            elif len(group) == 1 and HEADING_PATTERN.match(passage):
+                pending_heading = passage if pending_heading is None else pending_heading + "\n" + passage
+            else:
+                if pending_heading is not None:
+                    passage = pending_heading + "\n\n" + passage
+                    pending_heading = None
+                passages.append(passage)
+
+    if pending_heading is not None:
+        passages.append(pending_heading)
+    return passages
+
+
+def _split_bodies(bodies):
+    passages, passage_bodies = [], []
+    for row, body in enumerate(bodies):
+        for passage in split_passages(body):
+            passages.append(passage)
+            passage_bodies.append(row)
+    return passages, passage_bodies
+
+
+class PassageIndex:
+    """
+    Index over the passages of every distinct knowledge base answer body. Scoring is delegated to a ranker
+    (see retrieval/rankers.py), whose column-wise postings make this a sparse inverted index: a query only
+    touches the postings of its own terms, which keeps lookups well under a millisecond as the KB grows.
+    """
+    def __init__(self, bodies, preprocess_many, ranker, format_many=list):
+        self.passages, passage_bodies = _split_bodies(bodies)
+        self.passage_bodies = np.asarray(passage_bodies, dtype=np.int32)
+        # Display-ready copies of self.passages, so a match can be returned without further NLP.
+        self.formatted_passages = format_many(self.passages)
+        self.ranker = ranker.fit(preprocess_many(self.passages))
+
+    def updated(self, selection, n_bodies, added_bodies, preprocess_many, format_many=list):
+        """
+        Returns a new passage index after an edit of the knowledge base, leaving this one untouched.
+        The new bodies are this index's n_bodies bodies followed by added_bodies, in the order
+        given by selection (see Ranker.updated); only the passages of added_bodies are split,
+        preprocessed and formatted.
+        """
+        added_passages, added_passage_bodies = _split_bodies(added_bodies)
+        n_passages = len(self.passages)
+        # Every passage's body row in the new order, or -1 if its body was removed.
+        new_rows = np.full(n_bodies + len(added_bodies), -1, dtype=np.int64)
+        new_rows[selection] = np.arange(len(selection))
+        old_and_added = np.concatenate([self.passage_bodies, np.asarray(added_passage_bodies, dtype=np.int64) + n_bodies])
+        passage_rows = new_rows[old_and_added]
+        kept = np.flatnonzero(passage_rows >= 0)
+        # A stable sort keeps each body's passages in their original order.
+        passage_selection = kept[np.argsort(passage_rows[kept], kind="stable")]
+
+        index = PassageIndex.__new__(PassageIndex)
+        added_formatted = format_many(added_passages)
+        index.passages = [
+            self.passages[i] if i < n_passages else added_passages[i - n_passages] for i in passage_selection
+        ]
+        index.formatted_passages = [
+            self.formatted_passages[i] if i < n_passages else added_formatted[i - n_passages] for i in passage_selection
+        ]
+        index.passage_bodies = passage_rows[passage_selection].astype(np.int32)
+        index.ranker = self.ranker.updated(passage_selection, preprocess_many(added_passages))
+        return index
+
+    def search(self, processed_query):
+        """
+        Scores passages against an already preprocessed query.
+        Returns (passage_ids, scores) for the passages sharing at least one term with the query.
+        """
+        return self.ranker.search(processed_query)
+
+    def search_many(self, processed_queries):
+        """
+        Scores a batch of preprocessed queries at once; returns a queries x passages CSR matrix.
+        """
+        return self.ranker.search_many(processed_queries)
+
+    def to_arrays(self):
+        """
+        Returns the passage texts, their body rows and the ranker state as plain arrays.
+        """
+        passages = TextTable.pack(self.passages)
+        formatted = TextTable.pack(self.formatted_passages)
+        arrays = {
+            "text_blob": passages.blob,
+            "text_offsets": passages.offsets,
+            "formatted_blob": formatted.blob,
+            "formatted_offsets": formatted.offsets,
+            "bodies": self.passage_bodies,
+        }
+        arrays.update({f"ranker.{name}": array for name, array in self.ranker.to_arrays().items()})
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays, ranker_class):
+        """
+        Rebuilds a passage index from to_arrays() output without copying the arrays.
+        """
+        index = cls.__new__(cls)
+        index.passages = TextTable(arrays["text_blob"], arrays["text_offsets"])
+        index.formatted_passages = TextTable(arrays["formatted_blob"], arrays["formatted_offsets"])
+        index.passage_bodies = arrays["bodies"]
+        index.ranker = ranker_class.from_arrays(
+            {name[len("ranker."):]: array for name, array in arrays.items() if name.startswith("ranker.")}
+        )
+        return index
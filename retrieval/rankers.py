@@ -0,0 +1,266 @@
+import copy
+
+import numpy as np
+from scipy.sparse import csc_matrix, csr_matrix, vstack
+
+from .artifact import TextTable
+
+
+class Ranker:
+    """
+    Scores preprocessed documents (space-separated lemmas) against a preprocessed query.
+    The ranker keeps the raw term counts (self.counts, a documents x terms CSC matrix) and
+    self.postings, the same matrix with every count replaced by its weight, whose columns are
+    the postings lists. Subclasses define how counts are weighted (_weigh) and how a query is
+    turned into term weights. A document's score is the dot product of its row with the query
+    weights, computed by walking only the query terms' postings.
+
+    Document frequencies are the column lengths of the counts matrix, so documents can be added
+    and removed with updated() without re-tokenising the rest of the collection.
+    """
+    name = None
+
+    def fit(self, processed_docs):
+        self.vocabulary = {}
+        self._set_counts(self._count_terms(processed_docs, 0).tocsc())
+        return self
+
+    def _weigh(self, counts, document_frequency):
+        """
+        Returns (weights, idf): the weight of every entry of counts.data, and the terms' IDF.
+        """
+        raise NotImplementedError
+
+    def _count_terms(self, processed_docs, n_terms):
+        """
+        Returns a documents x terms CSR matrix of raw term counts. Unseen terms are added to
+        self.vocabulary as new columns, numbered from n_terms.
+        """
+        rows, cols, counts = [], [], []
+        for doc_id, processed in enumerate(processed_docs):
+            term_counts = {}
+            for term in processed.split():
+                term_id = self.vocabulary.get(term)
+                if term_id is None:
+                    term_id = self.vocabulary[term] = n_terms
+                    n_terms += 1
+                term_counts[term_id] = term_counts.get(term_id, 0) + 1
+            rows.extend([doc_id] * len(term_counts))
+            cols.extend(term_counts.keys())
+            counts.extend(term_counts.values())
+        return csr_matrix(
+            (np.asarray(counts, dtype=np.float32), (rows, cols)), shape=(len(processed_docs), n_terms)
+        )
+
+    def _set_counts(self, counts):
+        counts.sort_indices()
+        self.counts = counts
+        weights, self.idf = self._weigh(counts, np.diff(counts.indptr))
+        self.postings = csc_matrix((weights, counts.indices, counts.indptr), shape=counts.shape)
+
+    def updated(self, selection, processed_docs):
+        """
+        Returns a new ranker over an edited collection, leaving this one untouched so readers
+        holding it keep a consistent view. The new documents are this ranker's documents followed
+        by processed_docs, taken in the order given by selection (positions into that combined
+        list); documents left out are removed. Only processed_docs are tokenised: their count rows
+        are appended, new terms get new columns, and the weights and IDF are recomputed from the
+        counts with array operations.
+        """
+        ranker = copy.copy(self)
+        ranker.vocabulary = dict(self.vocabulary)
+        added = ranker._count_terms(processed_docs, self.counts.shape[1])
+        existing = self.counts.tocsr()
+        existing.resize(existing.shape[0], added.shape[1])
+        combined = vstack([existing, added], format="csr")
+        ranker._set_counts(combined[selection].tocsc())
+
+        # Terms whose last document was removed keep their (now empty) column but leave the
+        # vocabulary, so queries ignore them exactly as a fresh fit would.
+        dead_terms = np.diff(ranker.counts.indptr) == 0
+        if dead_terms.any():
+            ranker.vocabulary = {term: term_id for term, term_id in ranker.vocabulary.items() if not dead_terms[term_id]}
+        return ranker
+
+    def query_weights(self, processed_query):
+        """
+        Returns (term_ids, weights) for the query terms found in the vocabulary.
+        """
+        raise NotImplementedError
+
+    def _query_term_counts(self, processed_query):
+        term_counts = {}
+        for term in processed_query.split():
+            term_id = self.vocabulary.get(term)
+            if term_id is not None:
+                term_counts[term_id] = term_counts.get(term_id, 0) + 1
+        return (
+            np.fromiter(term_counts.keys(), dtype=np.int64, count=len(term_counts)),
+            np.fromiter(term_counts.values(), dtype=np.float32, count=len(term_counts)),
+        )
+
+    def to_arrays(self):
+        """
+        Returns the fitted state as plain arrays, for writing into an index artifact.
+        """
+        # Columns of removed terms are stored as empty strings, which no query token can match.
+        terms = [""] * self.postings.shape[1]
+        for term, term_id in self.vocabulary.items():
+            terms[term_id] = term
+        terms = TextTable.pack(terms)
+        return {
+            "terms_blob": terms.blob,
+            "terms_offsets": terms.offsets,
+            "idf": np.asarray(self.idf, dtype=np.float32),
+            "indptr": self.postings.indptr,
+            "indices": self.postings.indices,
+            "data": self.postings.data,
+            "counts": self.counts.data,
+            "shape": np.asarray(self.postings.shape, dtype=np.int64),
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """
+        Rebuilds a fitted ranker from to_arrays() output. The postings use the arrays as they are,
+        so memory-mapped arrays stay shared instead of being copied.
+        """
+        ranker = cls()
+        terms = TextTable(arrays["terms_blob"], arrays["terms_offsets"])
+        ranker.vocabulary = {term: term_id for term_id, term in enumerate(terms) if term}
+        ranker.idf = arrays["idf"]
+        shape = tuple(arrays["shape"])
+        ranker.postings = csc_matrix((arrays["data"], arrays["indices"], arrays["indptr"]), shape=shape, copy=False)
+        ranker.counts = csc_matrix((arrays["counts"], arrays["indices"], arrays["indptr"]), shape=shape, copy=False)
+        return ranker
+
+    def query_matrix(self, processed_queries):
+        """
+        Returns a queries x terms CSR matrix of query weights, one row per query.
+        """
+        rows, cols, data = [], [], []
+        for row, processed_query in enumerate(processed_queries):
+            term_ids, weights = self.query_weights(processed_query)
+            rows.extend([row] * len(term_ids))
+            cols.extend(term_ids)
+            data.extend(weights)
+        return csr_matrix(
+            (np.asarray(data, dtype=np.float32), (rows, cols)),
+            shape=(len(processed_queries), self.postings.shape[1]),
+        )
+
+    def search_many(self, processed_queries):
+        """
+        Scores a batch of queries with a single sparse matrix product.
+        Returns a queries x documents CSR matrix holding only the non-zero scores.
+        """
+        return (self.query_matrix(processed_queries) @ self.postings.T).tocsr()
+
+    def search(self, processed_query):
+        """
+        Returns (doc_ids, scores) for the documents sharing at least one term with the query.
+        """
+        return self.search_weights(*self.query_weights(processed_query))
+
+    def search_weights(self, term_ids, weights):
+        """
+        search() for a query already turned into (term_ids, weights) by query_weights().
+        """
+        if not len(term_ids):
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+        indptr, indices, data = self.postings.indptr, self.postings.indices, self.postings.data
+        hit_docs = np.concatenate([indices[indptr[t]:indptr[t + 1]] for t in term_ids])
+        hit_scores = np.concatenate(
+            [data[indptr[t]:indptr[t + 1]] * w for t, w in zip(term_ids, weights)]
+        )
+        doc_ids, inverse = np.unique(hit_docs, return_inverse=True)
+        return doc_ids, np.bincount(inverse, weights=hit_scores).astype(np.float32)
+
+
+class TfidfRanker(Ranker):
+    """
+    The original matcher: TF-IDF vectors with cosine similarity, weighted exactly as sklearn's
+    TfidfVectorizer defaults (raw counts times the smoothed IDF, rows L2-normalised), so the dot
+    product with the normalised query vector is the cosine. The weights are computed from the
+    counts directly, so the ranker can be updated in place of a refit and needs no sklearn.
+    """
+    name = "tfidf"
+
+    def _weigh(self, counts, document_frequency):
+        n_docs = counts.shape[0]
+        idf = (np.log((1 + n_docs) / (1 + document_frequency)) + 1).astype(np.float32)
+        doc_ids = counts.indices
+        weights = counts.data * np.repeat(idf, document_frequency)
+        norms = np.sqrt(np.bincount(doc_ids, weights=weights * weights, minlength=n_docs)).astype(np.float32)
+        return weights / norms[doc_ids], idf
+
+    def query_weights(self, processed_query):
+        term_ids, counts = self._query_term_counts(processed_query)
+        weights = counts * self.idf[term_ids]
+        if weights.size:
+            weights /= np.linalg.norm(weights)
+        return term_ids, weights
+
+
+class Bm25Ranker(Ranker):
+    """
+    Okapi BM25 over the same preprocessed tokens. The term-frequency part of every posting is
+    precomputed from the counts and divided by (k1 + 1), and the query weights are the query terms'
+    IDFs divided by their sum, so scores land in [0, 1) and stay comparable to a fixed threshold.
+    """
+    name = "bm25"
+
+    def __init__(self, k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+
+    def _weigh(self, counts, document_frequency):
+        n_docs = counts.shape[0]
+        doc_ids = counts.indices
+        tf = counts.data
+        doc_lengths = np.bincount(doc_ids, weights=tf, minlength=n_docs).astype(np.float32)
+        average_length = doc_lengths.mean() if n_docs and doc_lengths.mean() > 0 else 1.0
+        length_norm = self.k1 * (1 - self.b + self.b * doc_lengths[doc_ids] / average_length)
+        saturated_tf = tf * (self.k1 + 1) / (tf + length_norm) / (self.k1 + 1)
+        # The "+ 1" variant of the BM25 IDF, which never goes negative for very common terms.
+        idf = np.log(1 + (n_docs - document_frequency + 0.5) / (document_frequency + 0.5)).astype(np.float32)
+        return saturated_tf.astype(np.float32), idf
+
+    def query_weights(self, processed_query):
+        term_ids, counts = self._query_term_counts(processed_query)
+        weights = counts * self.idf[term_ids]
+        if weights.size:
+            weights /= weights.sum()
+        return term_ids, weights
+
+
+RANKERS = {
+    TfidfRanker.name: TfidfRanker,
+    Bm25Ranker.name: Bm25Ranker,
+}
+
+
+def make_ranker(name, **params):
+    """
+    Returns an unfitted ranker by its config name ("tfidf" or "bm25").
+    """
+    try:
+        return RANKERS[name.lower()](**params)
+    except KeyError:
+        raise ValueError(f"Unknown ranker '{name}'. Choose one of: {', '.join(RANKERS)}") from None
+
+
+def top_k(scores, k):
+    """
+    Returns the positions of the k highest scores, best first, for the sparse hits of a search.
+    Only the hits are partitioned (np.argpartition) and only the survivors are sorted, so the cost
+    stays proportional to the number of hits. Ties keep their original order.
+    """
+    if k <= 0 or not scores.size:
+        return np.empty(0, dtype=np.intp)
+    if scores.size > k:
+        kth_score = scores[np.argpartition(-scores, k - 1)[k - 1]]
+        candidates = np.flatnonzero(scores >= kth_score)
+    else:
+        candidates = np.arange(scores.size)
+    return candidates[np.argsort(-scores[candidates], kind="stable")][:k]
@@ -0,0 +1,128 @@
+import numpy as np
+
+from .config import (
+    BODY_FIELD_WEIGHT, HYBRID_FUSION, HYBRID_SEMANTIC_WEIGHT, KEY_FIELD_WEIGHT, RRF_K, SEMANTIC_CANDIDATES,
+    SEMANTIC_SIMILARITY_THRESHOLD, SIMILARITY_THRESHOLD, SUGGESTION_THRESHOLD
+)
+from .rankers import top_k
+
+
+def merge_fields(kb_index, key_ids, key_scores, passage_ids, passage_scores):
+    """
+    Combines key and passage hits into one candidate per answer body, holding the body's best field,
+    so aliases of one answer never compete with each other.
+    Returns (body_rows, scores, sources); a source is the passage id for a passage hit, or -1 - key_id
+    for a key hit, where the whole answer applies.
+    """
+    body_rows = np.concatenate([kb_index.key_bodies[key_ids], kb_index.passage_index.passage_bodies[passage_ids]])
+    scores = np.concatenate([key_scores * KEY_FIELD_WEIGHT, passage_scores * BODY_FIELD_WEIGHT])
+    sources = np.concatenate([-1 - key_ids.astype(np.int64), passage_ids])
+
+    # lexsort is stable and key hits come first, so the key wins ties.
+    order = np.lexsort((-scores, body_rows))
+    body_rows, scores, sources = body_rows[order], scores[order], sources[order]
+    first_of_body = np.ones(body_rows.size, dtype=bool)
+    first_of_body[1:] = body_rows[1:] != body_rows[:-1]
+    return body_rows[first_of_body], scores[first_of_body], sources[first_of_body]
+
+
+def lexical_query_weights(kb_index, processed_query):
+    """
+    Returns the processed query's (term_ids, weights) in the key ranker and in the passage ranker.
+    """
+    return kb_index.key_ranker.query_weights(processed_query), kb_index.passage_index.ranker.query_weights(processed_query)
+
+
+def rank_kb_entries(kb_index, processed_query, query_weights=None):
+    """
+    Scores every answer that shares a term with the processed query, on its keys and on its passages.
+    query_weights, if already computed by lexical_query_weights, saves weighting the query again.
+    """
+    key_weights, passage_weights = query_weights or lexical_query_weights(kb_index, processed_query)
+    key_ids, key_scores = kb_index.key_ranker.search_weights(*key_weights)
+    passage_ids, passage_scores = kb_index.passage_index.ranker.search_weights(*passage_weights)
+    return merge_fields(kb_index, key_ids, key_scores, passage_ids, passage_scores)
+
+
+def rank_kb_entries_semantic(kb_index, semantic_index, query_vector):
+    """
+    Semantic counterpart of rank_kb_entries: scores the keys and passages closest to the query embedding.
+    """
+    key_ids, key_scores = semantic_index.key_vectors.search(query_vector, SEMANTIC_CANDIDATES)
+    passage_ids, passage_scores = semantic_index.passage_search.search(query_vector, SEMANTIC_CANDIDATES)
+    return merge_fields(kb_index, key_ids, key_scores, passage_ids, passage_scores)
+
+
+def fuse_candidates(lexical, semantic, method=HYBRID_FUSION):
+    """
+    Fuses the per-answer candidates of a lexical and a semantic search, each a (body_rows, scores, sources)
+    triple from merge_fields. "rrf" sums 1 / (RRF_K + rank) over the two rankings; "weighted" sums the
+    scores, the semantic side weighted by HYBRID_SEMANTIC_WEIGHT.
+    Semantic scores are first mapped onto the lexical scale, piecewise linearly so that the semantic
+    threshold lands on the lexical one; each answer then reports its better score of the two, and one
+    threshold decides whether either retriever is confident. Returns (body_rows, scores, sources, fused):
+    the answer candidates with their best field, and the fused values that rank them.
+    """
+    if method not in ("rrf", "weighted"):
+        raise ValueError(f"Unknown fusion method '{method}'. Choose rrf or weighted")
+    lexical_rows, lexical_scores, lexical_sources = lexical
+    semantic_rows, semantic_scores, semantic_sources = semantic
+    semantic_scores = np.interp(
+        semantic_scores, [0, SEMANTIC_SIMILARITY_THRESHOLD, 1], [0, SIMILARITY_THRESHOLD, 1]
+    ).astype(np.float32)
+    if method == "rrf":
+        contributions = [1 / (RRF_K + _ranks(lexical_scores)), 1 / (RRF_K + _ranks(semantic_scores))]
+    else:
+        contributions = [(1 - HYBRID_SEMANTIC_WEIGHT) * lexical_scores, HYBRID_SEMANTIC_WEIGHT * semantic_scores]
+
+    body_rows = np.concatenate([lexical_rows, semantic_rows])
+    scores = np.concatenate([lexical_scores, semantic_scores])
+    sources = np.concatenate([lexical_sources, semantic_sources])
+    unique_rows, inverse = np.unique(body_rows, return_inverse=True)
+    fused = np.bincount(inverse, weights=np.concatenate(contributions), minlength=unique_rows.size)
+
+    # As in merge_fields: per answer keep the better field, lexical first on ties.
+    order = np.lexsort((-scores, body_rows))
+    first_of_body = np.ones(body_rows.size, dtype=bool)
+    first_of_body[1:] = body_rows[order][1:] != body_rows[order][:-1]
+    best = order[first_of_body]
+    return body_rows[best], scores[best], sources[best], fused.astype(np.float32)
+
+
+def _ranks(scores):
+    # 1 for the best score, 2 for the next, and so on.
+    ranks = np.empty(scores.size, dtype=np.float64)
+    ranks[np.argsort(-scores, kind="stable")] = np.arange(1, scores.size + 1)
+    return ranks
+
+
+def top_k_matches(kb_index, body_rows, scores, sources, k, order_by=None):
+    """
+    Picks the k best candidates and returns them as (key, score, passage) tuples, best first.
+    Candidates are ranked by their scores, or by order_by if given (fused values in hybrid mode).
+    key is the alias that matched, or the answer's first key for a passage match; passage is the
+    display-ready text formatted when the index was built.
+    """
+    matches = []
+    for position in top_k(scores if order_by is None else order_by, k):
+        body = body_rows[position]
+        source = sources[position]
+        if source < 0:
+            key = kb_index.keys[-1 - source]
+            passage = kb_index.formatted_bodies[body]
+        else:
+            key = kb_index.keys[kb_index.body_keys[body]]
+            passage = kb_index.passage_index.formatted_passages[source]
+        matches.append((key, float(scores[position]), passage))
+    return matches
+
+
+def format_did_you_mean(matches, suggestion_threshold=SUGGESTION_THRESHOLD):
+    """
+    Turns near-miss matches into a "did you mean" hint, or returns None if none are close enough.
+    Pass the engine's suggestion_threshold, which depends on its retrieval mode.
+    """
+    suggestions = [key for key, score, _ in matches if score >= suggestion_threshold]
+    if not suggestions:
+        return None
+    return "Did you mean: " + ", ".join(f"**{key}**" for key in suggestions) + "?"
@@ -0,0 +1,253 @@
+"""
+Dense semantic retrieval: one embedding per KB key and per answer passage (see nlp.embed_texts),
+held in a contiguous float32 or int8 matrix and scored against the query embedding with a single
+matrix-vector product. Paraphrases that share no lemmas with a key ("who runs the country" and
+"nigerian president") still land close together.
+
+The matrices are compiled into their own artifact next to the lexical one (see retrieval/artifact.py)
+and rebuilt when the KB content, the embedding model or the storage dtype changes. Large KBs also get
+an IVF index over the passages (see retrieval/ann.py), built and saved with them.
+"""
+import threading
+
+import numpy as np
+
+from .ann import IvfIndex, default_n_lists
+from .artifact import load_or_build_artifact, open_artifact, write_artifact
+from .config import (
+    ANN_LISTS, ANN_MIN_PASSAGES, ANN_PROBES, EMBEDDING_DTYPE, EMBEDDING_MODEL, NLP_BATCH_SIZE, kb_index_path
+)
+from .index import _with_prefix
+from .nlp import SPACY_MODEL, embed_texts
+from .rankers import top_k
+
+ARTIFACT_VERSION = 2
+# int8 rows are dequantised this many at a time, which bounds the temporary float32 copy.
+INT8_BLOCK_ROWS = 8192
+
+
+class DenseIndex:
+    """
+    Brute-force cosine search over L2-normalised row vectors. With dtype="int8" every row is
+    stored as int8 times a per-row float32 scale (its largest magnitude / 127): a quarter of the
+    memory, at about 1% error in the scores.
+    """
+    def __init__(self, vectors, dtype="float32"):
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if dtype == "int8":
+            scales = np.abs(vectors).max(axis=1) / 127 if vectors.size else np.zeros(len(vectors), dtype=np.float32)
+            scales[scales == 0] = 1
+            self.matrix = np.round(vectors / scales[:, None]).astype(np.int8)
+            self.scales = scales.astype(np.float32)
+        elif dtype == "float32":
+            self.matrix = vectors
+            self.scales = None
+        else:
+            raise ValueError(f"Unknown embedding dtype '{dtype}'. Choose float32 or int8")
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    def vectors(self, rows):
+        """
+        Returns the (dequantised) float32 vectors of the given rows.
+        """
+        vectors = self.matrix[rows].astype(np.float32)
+        return vectors if self.scales is None else vectors * self.scales[rows, None]
+
+    def scores(self, query_vectors):
+        """
+        Returns the rows x queries matrix of cosine similarities for a queries x width matrix.
+        """
+        if self.scales is None:
+            return self.matrix @ query_vectors.T
+        scores = np.empty((len(self), query_vectors.shape[0]), dtype=np.float32)
+        for start in range(0, len(self), INT8_BLOCK_ROWS):
+            block = self.matrix[start:start + INT8_BLOCK_ROWS].astype(np.float32)
+            scores[start:start + len(block)] = block @ query_vectors.T
+        return scores * self.scales[:, None]
+
+    def search_many(self, query_vectors, n):
+        """
+        Returns a list with the (row_ids, scores) of the n closest rows to each query, keeping only
+        positive similarities. Queries that embed to nothing (no known words) get no hits.
+        """
+        results = []
+        if not len(self) or query_vectors.shape[1] != self.matrix.shape[1]:
+            empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32))
+            return [empty] * query_vectors.shape[0]
+        for column in self.scores(query_vectors).T:
+            hits = np.flatnonzero(column > 0)
+            best = hits[top_k(column[hits], n)]
+            results.append((best, column[best].astype(np.float32)))
+        return results
+
+    def search(self, query_vector, n):
+        """
+        Single-query version of search_many.
+        """
+        return self.search_many(query_vector[None, :], n)[0]
+
+    def to_arrays(self):
+        arrays = {"matrix": self.matrix}
+        if self.scales is not None:
+            arrays["scales"] = self.scales
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        index = cls.__new__(cls)
+        index.matrix = arrays["matrix"]
+        index.scales = arrays.get("scales")
+        return index
+
+
+class SemanticIndex:
+    """
+    The key and passage embeddings for one KnowledgeBaseIndex, row-aligned with its keys and its
+    passage index. Build one with build(), which re-embeds only the texts that a previous version
+    of the KB did not have, or map a compiled one with from_artifact().
+    passage_search is what passage lookups go through: the IVF index over the passage vectors if
+    there is one, otherwise the passage vectors themselves.
+    """
+    def __init__(self, content_hash, model_name, dtype, key_vectors, passage_vectors, passage_ann=None):
+        self.content_hash = content_hash
+        self.model_name = model_name
+        self.dtype = dtype
+        self.key_vectors = key_vectors
+        self.passage_vectors = passage_vectors
+        self.passage_ann = passage_ann
+        self.passage_search = passage_ann or passage_vectors
+
+    @classmethod
+    def build(cls, kb_index, model_name, dtype=EMBEDDING_DTYPE, previous=None, batch_size=NLP_BATCH_SIZE):
+        """
+        Embeds every key and passage of kb_index. previous, a (kb_index, semantic_index) pair for an
+        earlier version of the KB embedded with the same model, lends its vectors for unchanged texts
+        and its IVF centroids, which a couple of k-means rounds adapt to the edited passages.
+        """
+        if previous is not None and previous[1].model_name != model_name:
+            previous = None
+        key_vectors = _embed_reusing(
+            list(kb_index.keys), previous and (previous[0].keys, previous[1].key_vectors), batch_size
+        )
+        passage_vectors = _embed_reusing(
+            list(kb_index.passage_index.passages),
+            previous and (previous[0].passage_index.passages, previous[1].passage_vectors),
+            batch_size,
+        )
+        passage_vectors = DenseIndex(passage_vectors, dtype)
+        passage_ann = None
+        n_lists = ann_list_count(len(passage_vectors))
+        if n_lists:
+            previous_ann = previous and previous[1].passage_ann
+            if previous_ann is not None and len(previous_ann.centroids) == n_lists:
+                passage_ann = IvfIndex.build(
+                    passage_vectors, n_lists, ANN_PROBES, n_iter=2, centroids=previous_ann.centroids
+                )
+            else:
+                passage_ann = IvfIndex.build(passage_vectors, n_lists, ANN_PROBES)
+        return cls(
+            kb_index.content_hash, model_name, dtype, DenseIndex(key_vectors, dtype), passage_vectors, passage_ann
+        )
+
+    def save(self, path):
+        arrays = {f"keys.{name}": array for name, array in self.key_vectors.to_arrays().items()}
+        arrays.update({f"passages.{name}": array for name, array in self.passage_vectors.to_arrays().items()})
+        if self.passage_ann is not None:
+            arrays.update({f"passages_ann.{name}": array for name, array in self.passage_ann.to_arrays().items()})
+        metadata = {
+            "version": ARTIFACT_VERSION,
+            "content_hash": self.content_hash,
+            "model_name": self.model_name,
+            "dtype": self.dtype,
+            "ann_lists": len(self.passage_ann.centroids) if self.passage_ann is not None else 0,
+        }
+        write_artifact(path, arrays, metadata)
+
+    @classmethod
+    def from_artifact(cls, path, n_probes=ANN_PROBES):
+        """
+        Memory-maps a compiled semantic index; n_probes, unlike the IVF lists, can change between runs.
+        """
+        metadata, arrays = open_artifact(path)
+        passage_vectors = DenseIndex.from_arrays(_with_prefix(arrays, "passages."))
+        ann_arrays = _with_prefix(arrays, "passages_ann.")
+        passage_ann = IvfIndex.from_arrays(ann_arrays, passage_vectors, n_probes) if ann_arrays else None
+        return cls(
+            metadata["content_hash"],
+            metadata["model_name"],
+            metadata["dtype"],
+            DenseIndex.from_arrays(_with_prefix(arrays, "keys.")),
+            passage_vectors,
+            passage_ann,
+        )
+
+
+def _embed_reusing(texts, previous, batch_size):
+    # previous is (old_texts, old_dense_index) or None; only texts it does not have are embedded.
+    if previous is None:
+        return embed_texts(texts, batch_size=batch_size)
+    old_rows = {text: row for row, text in enumerate(previous[0])}
+    reused = [(row, old_rows[text]) for row, text in enumerate(texts) if text in old_rows]
+    missing = [row for row, text in enumerate(texts) if text not in old_rows]
+    new_vectors = embed_texts([texts[row] for row in missing], batch_size=batch_size)
+    width = new_vectors.shape[1] if missing else previous[1].matrix.shape[1]
+    vectors = np.zeros((len(texts), width), dtype=np.float32)
+    if reused:
+        rows, old = zip(*reused)
+        vectors[list(rows)] = previous[1].vectors(list(old))
+    if missing:
+        vectors[missing] = new_vectors
+    return vectors
+
+
+def ann_list_count(n_passages):
+    """
+    Returns how many IVF lists a semantic index over n_passages passages gets: 0 (no ANN index,
+    exact search) below ANN_MIN_PASSAGES, otherwise ANN_LISTS or the default for that size.
+    """
+    if n_passages < ANN_MIN_PASSAGES:
+        return 0
+    return min(ANN_LISTS or default_n_lists(n_passages), n_passages)
+
+
+def embedding_model_name():
+    """
+    Returns the name of the spaCy model that embeds texts (see nlp.load_embedding_pipeline).
+    """
+    return EMBEDDING_MODEL or SPACY_MODEL
+
+
+# The semantic index of the most recent KB index, shared like the KB index itself.
+_semantic = None
+_semantic_lock = threading.Lock()
+
+
+def get_semantic_index(kb_index, dtype=EMBEDDING_DTYPE):
+    """
+    Returns the shared SemanticIndex for kb_index. The compiled artifact next to kb_index's KB data
+    file (see KnowledgeBaseIndex.source_path) is memory-mapped if it was built for the same KB content,
+    model, dtype and IVF lists; otherwise the index is built, reusing the vectors of the previous KB
+    version's unchanged texts, and saved there. An index of an in-memory dict has no artifact.
+    """
+    global _semantic
+    semantic = _semantic
+    if semantic is not None and semantic[0] is kb_index and semantic[1].dtype == dtype:
+        return semantic[1]
+
+    with _semantic_lock:
+        if _semantic is not None and _semantic[0] is kb_index and _semantic[1].dtype == dtype:
+            return _semantic[1]
+        model_name = embedding_model_name()
+        current = {"version": ARTIFACT_VERSION, "content_hash": kb_index.content_hash, "model_name": model_name,
+                   "dtype": dtype, "ann_lists": ann_list_count(len(kb_index.passage_index.passages))}
+        # Only an index of a KB data file has an artifact: one of an in-memory dict is embedded every time.
+        semantic_index = load_or_build_artifact(
+            kb_index_path(kb_index.source_path, "semantic") if kb_index.source_path else None,
+            lambda metadata: all(metadata.get(name) == value for name, value in current.items()),
+            SemanticIndex.from_artifact,
+            lambda: SemanticIndex.build(kb_index, model_name, dtype, previous=_semantic),
+        )
+        _semantic = (kb_index, semantic_index)
+        return semantic_index
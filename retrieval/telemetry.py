@@ -0,0 +1,262 @@
+"""
+Per-query latency instrumentation, cheap enough to leave on in production.
+
+A QueryTrace times the stages a chat message goes through (small-talk check, key lookup,
+preprocessing, query vectorisation, similarity scoring, formatting and streaming), and on
+finish() adds them to in-process histograms. Each histogram is a fixed list of bucket counts, so
+recording costs a bisect and a locked increment. A sampled share of traces (TELEMETRY_SAMPLE_RATE)
+is also written as one JSON line to a structured log, with the matched key and score. The log
+lines are handed to a background thread, so a slow log pipe never holds up a query.
+
+    trace = start_trace()
+    with trace.stage("preprocess"):
+        ...
+    trace.annotate(key=key, score=score)
+    trace.finish()
+
+TELEMETRY.snapshot() returns every histogram and counter, for a metrics endpoint.
+"""
+import bisect
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import threading
+import time
+
+from .config import TELEMETRY_ENABLED, TELEMETRY_LOG_PATH, TELEMETRY_SAMPLE_RATE
+
+# Upper bounds, in seconds, of the latency buckets: 100 microseconds to 10 seconds.
+LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+# The paths (see QueryTrace.finish) of queries that ran the KB retrieval: not small talk or answer cache hits.
+KB_PATHS = ("key_lookup", "search", "batch")
+# Upper bounds of the match score buckets.
+SCORE_BUCKETS = tuple(round(0.05 * i, 2) for i in range(1, 21))
+
+
+class Histogram:
+    """
+    Counts observations into fixed buckets: counts[i] holds the values up to bounds[i] (and above
+    bounds[i - 1]); the last count holds everything above the last bound.
+    """
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        bucket = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[bucket] += 1
+            self.sum += value
+            self.count += 1
+
+    def snapshot(self):
+        """
+        Returns the bucket bounds, counts, sum and count as a dict.
+        """
+        with self._lock:
+            return {"bounds": list(self.bounds), "counts": list(self.counts), "sum": self.sum, "count": self.count}
+
+    def quantile(self, q):
+        """
+        Estimates the q-quantile (0 to 1) by interpolating linearly within its bucket; None if empty.
+        """
+        snapshot = self.snapshot()
+        if not snapshot["count"]:
+            return None
+        rank = q * snapshot["count"]
+        seen = 0
+        for bucket, count in enumerate(snapshot["counts"]):
+            if count and seen + count >= rank:
+                if bucket == len(self.bounds):
+                    return self.bounds[-1]  # Above the last bound: report the bound.
+                lower = self.bounds[bucket - 1] if bucket else 0.0
+                return lower + (self.bounds[bucket] - lower) * (rank - seen) / count
+            seen += count
+        return self.bounds[-1]
+
+
+class Telemetry:
+    """
+    The process-wide histograms and counters, created on first use.
+    """
+    def __init__(self):
+        self.histograms = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, value, bounds=LATENCY_BUCKETS):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(name, Histogram(bounds))
+        histogram.observe(value)
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def snapshot(self):
+        """
+        Returns {"histograms": {name: Histogram.snapshot()}, "counters": {name: value}}.
+        """
+        with self._lock:
+            histograms = dict(self.histograms)
+            counters = dict(self.counters)
+        return {"histograms": {name: histogram.snapshot() for name, histogram in histograms.items()},
+                "counters": counters}
+
+
+TELEMETRY = Telemetry()
+
+
+class _Stage:
+    __slots__ = ("trace", "name", "started")
+
+    def __init__(self, trace, name):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.trace.record(self.name, time.perf_counter() - self.started)
+
+
+class QueryTrace:
+    """
+    The stage timings and annotations of one query. A stage timed twice adds up.
+    """
+    def __init__(self, sampled):
+        self.started = time.perf_counter()
+        self.sampled = sampled
+        self.stages = {}
+        self.fields = {}
+
+    def stage(self, name):
+        """
+        Returns a context manager that times its block as the named stage.
+        """
+        return _Stage(self, name)
+
+    def record(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def annotate(self, **fields):
+        """
+        Attaches fields to the trace, such as the matched key and score or how the query was answered.
+        """
+        self.fields.update(fields)
+
+    def finish(self):
+        """
+        Records the stages, the message latency and the match score into the histograms, and the KB
+        retrieval latency for queries the KB answered by lookup or search (KB_PATHS); counts the query
+        under the way it was answered ("path"), and logs the trace if it was sampled.
+        """
+        total = time.perf_counter() - self.started
+        stages = list(self.stages.items())  # A timed-out hybrid search may still add its stage.
+        for name, seconds in stages:
+            TELEMETRY.observe(f"stage.{name}", seconds)
+        # The message latency is the time to an answer; streaming it out is paced on purpose.
+        answered_in = total - self.stages.get("stream", 0.0)
+        TELEMETRY.observe("message", answered_in)
+        if self.fields.get("path") in KB_PATHS:
+            # The retrieval latency proper (get_response_from_kb's): no small talk, no answer cache hits.
+            TELEMETRY.observe("kb_query", answered_in - self.stages.get("small_talk", 0.0))
+        score = self.fields.get("score")
+        if score is not None:
+            TELEMETRY.observe("score", score, SCORE_BUCKETS)
+        TELEMETRY.count("queries")
+        TELEMETRY.count(f"path.{self.fields.get('path', 'unknown')}")
+        if self.fields.get("answered") is False:
+            TELEMETRY.count("fallbacks")
+        if self.sampled:
+            record = {"event": "query", "total_ms": round(total * 1000, 3)}
+            record.update({f"{name}_ms": round(seconds * 1000, 3) for name, seconds in stages})
+            record.update(self.fields)
+            _log_record(record)
+
+
+class _NullTrace:
+    """
+    Stands in for QueryTrace when telemetry is off: every method does nothing.
+    """
+    sampled = False
+
+    def stage(self, name):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def record(self, name, seconds):
+        pass
+
+    def annotate(self, **fields):
+        pass
+
+    def finish(self):
+        pass
+
+
+NULL_TRACE = _NullTrace()
+
+
+def start_trace():
+    """
+    Starts timing a query. Returns a no-op trace if telemetry is off.
+    """
+    if not TELEMETRY_ENABLED:
+        return NULL_TRACE
+    return QueryTrace(sampled=random.random() < TELEMETRY_SAMPLE_RATE)
+
+
+# The structured log: records are queued by the query threads and written by a listener thread.
+_logger = None
+_logger_lock = threading.Lock()
+
+
+def _get_logger():
+    global _logger
+    if _logger is None:
+        with _logger_lock:
+            if _logger is None:
+                if TELEMETRY_LOG_PATH:
+                    handler = logging.FileHandler(TELEMETRY_LOG_PATH, encoding="utf-8")
+                else:
+                    handler = logging.StreamHandler(sys.stderr)
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                records = queue.SimpleQueue()
+                listener = logging.handlers.QueueListener(records, handler)
+                listener.start()
+                logger = logging.getLogger("govfocus.telemetry")
+                logger.setLevel(logging.INFO)
+                logger.propagate = False
+                logger.addHandler(logging.handlers.QueueHandler(records))
+                _logger = logger
+    return _logger
+
+
+def log_event(event, **fields):
+    """
+    Writes one JSON line for an event outside any query, such as a failed KB reload, to the structured log.
+    """
+    _log_record({"event": event, **fields})
+
+
+def _log_record(record):
+    record["ts"] = round(time.time(), 3)
+    _get_logger().info(json.dumps(record, ensure_ascii=False, default=str))
@@ -0,0 +1,102 @@
+"""
+Hot reloading must survive a bad edit to the KB data file: the previous version keeps serving,
+and the next valid edit is picked up (see engine.reload_engine, one tick of the watcher thread).
+"""
+import json
+
+import pytest
+
+from retrieval import engine, index
+from retrieval.kb_data import load_knowledge_base
+
+ENTRIES = [
+    {"key": "capital of nigeria", "answer": "Abuja is the capital of Nigeria."},
+    {"key": "nigerian currency", "answer": "The Naira is the currency of Nigeria."},
+    {"key": "abuja", "alias_of": "capital of nigeria"},
+]
+ADDED = {"key": "national anthem of nigeria", "answer": "Nigeria, We Hail Thee is the national anthem, adopted in 2024."}
+
+BAD_LINES = [
+    pytest.param({"key": "n", "answer": 5}, id="non-string answer"),
+    pytest.param({"key": ["a", "list"], "answer": "x"}, id="list key"),
+    pytest.param({"key": "", "answer": "x"}, id="empty key"),
+    pytest.param({"key": "a", "alias_of": 3}, id="non-string alias_of"),
+    pytest.param({"answer": "no key"}, id="missing key"),
+]
+
+
+def write_kb(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+
+
+@pytest.fixture
+def kb_path(tmp_path, monkeypatch):
+    """
+    A small KB data file, with fresh shared index and engine state pointing at it.
+    """
+    path = tmp_path / "kb.jsonl"
+    write_kb(path, ENTRIES)
+    monkeypatch.setattr(index, "KB_DATA_PATH", str(path))
+    monkeypatch.setattr(index, "_index", None)
+    monkeypatch.setattr(index, "_index_source", None)
+    monkeypatch.setattr(index, "_checked_signature", None)
+    monkeypatch.setattr(engine, "_engine", None)
+    engine.get_engine(retrieval_mode="lexical")
+    return path
+
+
+@pytest.mark.parametrize("bad_line", BAD_LINES)
+def test_bad_edit_keeps_the_previous_engine_and_the_next_edit_reloads(kb_path, bad_line):
+    before = engine.get_engine(retrieval_mode="lexical")
+    write_kb(kb_path, ENTRIES + [bad_line])
+
+    assert engine.reload_engine() is False
+    assert engine.get_engine(retrieval_mode="lexical") is before
+    assert len(before.kb_index) == 3
+
+    write_kb(kb_path, ENTRIES + [ADDED])
+    assert engine.reload_engine() is True
+    after = engine.get_engine(retrieval_mode="lexical")
+    assert len(after.kb_index) == 4
+    assert after.respond("national anthem of nigeria")[0] is not None
+
+
+def test_failing_engine_build_keeps_the_previous_engine(kb_path, monkeypatch):
+    before = engine.get_engine(retrieval_mode="lexical")
+    real_engine = engine.RetrievalEngine
+
+    def broken_engine(*args, **kwargs):
+        raise RuntimeError("engine construction failed")
+
+    monkeypatch.setattr(engine, "RetrievalEngine", broken_engine)
+    write_kb(kb_path, ENTRIES + [ADDED])
+    assert engine.reload_engine() is False
+    assert engine.get_engine(retrieval_mode="lexical") is before
+
+    monkeypatch.setattr(engine, "RetrievalEngine", real_engine)
+    write_kb(kb_path, ENTRIES + [ADDED, {"key": "naira", "alias_of": "nigerian currency"}])
+    assert engine.reload_engine() is True
+    assert len(engine.get_engine(retrieval_mode="lexical").kb_index) == 5
+
+
+def test_unchanged_file_is_not_reloaded(kb_path):
+    before = engine.get_engine(retrieval_mode="lexical")
+    assert engine.reload_engine() is False
+    assert engine.get_engine(retrieval_mode="lexical") is before
+
+
+@pytest.mark.parametrize("bad_line", BAD_LINES)
+def test_malformed_record_is_reported_with_its_line(tmp_path, bad_line):
+    path = tmp_path / "kb.jsonl"
+    write_kb(path, ENTRIES + [bad_line])
+    with pytest.raises(ValueError, match=r"kb\.jsonl:4: "):
+        load_knowledge_base(str(path))
+
+
+def test_parquet_without_an_answer_column_is_reported(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "kb.parquet"
+    pq.write_table(pa.table({"key": ["capital of nigeria"]}), str(path))
+    with pytest.raises(ValueError, match="missing column"):
+        load_knowledge_base(str(path))
@@ -0,0 +1,59 @@
+"""
+The lemma-lookup query normalizer (see nlp.preprocess_text_for_matching) must give exactly the
+tokens the full spaCy pipeline gives. benchmarks/normalizer_parity.py runs the same check with
+timings over any query file.
+"""
+import json
+import os
+
+import pytest
+
+from benchmarks.normalizer_parity import kb_queries
+from retrieval.config import PROJECT_ROOT
+from retrieval.index import KnowledgeBaseIndex, kb_content_hash
+from retrieval.kb_data import load_knowledge_base
+from retrieval.nlp import _lookup_processed_tokens, preprocess_text_for_matching
+
+KB_PATH = os.path.join(PROJECT_ROOT, "data", "knowledge_base.jsonl")
+QUERIES_PATH = os.path.join(PROJECT_ROOT, "benchmarks", "queries.jsonl")
+
+
+@pytest.fixture(scope="module")
+def kb_index():
+    # Built in memory from the shipped KB, so no artifact is read or written.
+    knowledge_base = load_knowledge_base(KB_PATH)
+    return KnowledgeBaseIndex(knowledge_base, kb_content_hash(knowledge_base), "tfidf")
+
+
+def mismatches(kb_index, queries):
+    found = []
+    for query in queries:
+        lookup, spacy = preprocess_text_for_matching(query, kb_index.lemma_table), preprocess_text_for_matching(query)
+        if lookup != spacy:
+            found.append((query, lookup, spacy))
+    return found
+
+
+def test_keys_normalise_as_spacy_does(kb_index):
+    keys = list(kb_index.keys)
+    # Every key is made of KB words, so the lookup path should take them all, not fall back.
+    assert all(_lookup_processed_tokens(key.lower(), kb_index.lemma_table) is not None for key in keys)
+    assert mismatches(kb_index, keys) == []
+
+
+def test_generated_queries_normalise_as_spacy_does(kb_index):
+    # Question templates around the keys, and passage openings: KB words in contexts the KB does not have.
+    assert mismatches(kb_index, kb_queries(kb_index)) == []
+
+
+def test_labelled_queries_normalise_as_spacy_does(kb_index):
+    with open(QUERIES_PATH, encoding="utf-8") as lines:
+        queries = [json.loads(line)["query"] for line in lines if line.strip()]
+    assert any(_lookup_processed_tokens(query.lower(), kb_index.lemma_table) is not None for query in queries)
+    assert mismatches(kb_index, queries) == []
+
+
+def test_unknown_words_fall_back_to_spacy(kb_index):
+    assert _lookup_processed_tokens("quantum chromodynamics", kb_index.lemma_table) is None
+    assert preprocess_text_for_matching("quantum chromodynamics", kb_index.lemma_table) == \
+        preprocess_text_for_matching("quantum chromodynamics")